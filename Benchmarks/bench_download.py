@@ -0,0 +1,73 @@
+"""
+Download write-path benchmark: the old 8 KiB iter_content loop vs. the download engine's readinto path.
+
+Both fetch the same synthetic archive from a local stand-in server over a single connection.
+Usage: py Benchmarks/bench_download.py [--size-mb 512] [--rounds 3]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import switch_core
+from server import start_server
+
+def legacy_loop(url, save_path):
+    """The pre-tuning loop: 8 KiB chunks, a clock read and a status string for every chunk"""
+    response = requests.get(url, stream=True, timeout=30)
+    response.raise_for_status()
+    total_length = int(response.headers.get('content-length', 0))
+    dl = 0
+    start_time = time.time()
+    with open(save_path, 'wb') as f:
+        for chunk in response.iter_content(chunk_size=8192):
+            if chunk:
+                f.write(chunk)
+                dl += len(chunk)
+                if total_length > 0:
+                    percent = int((dl / total_length) * 100)
+                    elapsed = time.time() - start_time
+                    speed = (dl / elapsed) if elapsed > 0 else 0
+                    _ = f"Downloading {os.path.basename(save_path)} | {percent}% | {speed / 1000000:.1f} MB/s"
+
+def engine_stream(url, save_path):
+    engine = switch_core.Downloader([(url, save_path)])
+    engine._download_stream(0, url, save_path, switch_core.StreamHasher(save_path), lambda *a: False)
+
+def measure(fn, url, save_path, size, rounds):
+    best = None
+    for _ in range(rounds):
+        wall, cpu = time.perf_counter(), time.process_time()
+        fn(url, save_path)
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        if os.path.getsize(save_path) != size: raise RuntimeError(f"{fn.__name__}: wrong size written")
+        os.remove(save_path)
+        if best is None or wall < best[0]: best = (wall, cpu)
+    return best
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--size-mb', type=int, default=512)
+    ap.add_argument('--rounds', type=int, default=3)
+    args = ap.parse_args()
+
+    size = args.size_mb * 1024 * 1024
+    proc, base_url = start_server()
+    try:
+        url = f"{base_url}/blob/{size}"
+        with tempfile.TemporaryDirectory() as tmp:
+            save_path = os.path.join(tmp, "Firmware_bench.zip")
+            print(f"{'path':<18}{'MB/s':>10}{'CPU s/GB':>12}")
+            for name, fn in (('iter_content 8K', legacy_loop), ('readinto', engine_stream)):
+                wall, cpu = measure(fn, url, save_path, size, args.rounds)
+                print(f"{name:<18}{size / wall / 1e6:>10.1f}{cpu / (size / 1e9):>12.2f}")
+    finally:
+        proc.terminate()
+
+if __name__ == '__main__':
+    main()
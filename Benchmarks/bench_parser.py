@@ -0,0 +1,91 @@
+"""
+Micro-benchmark: streaming VersionTableParser vs. the old whole-document regex scan.
+
+Both sides start from the same 64 KiB byte chunks a streamed response would deliver;
+peak memory therefore includes the joined body the old path had to build.
+
+Usage: py Benchmarks/bench_parser.py [--keys saved_keys.html] [--fw saved_fw.html] [--rounds 5]
+"""
+import argparse
+import codecs
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import switch_core
+from fixtures import make_keys_page, make_fw_page
+
+CHUNK = 65536
+
+# The pre-streaming implementation, kept verbatim for comparison
+def regex_parse_keys(html):
+    found = []
+    for row in re.findall(r'<tr.*?>(.*?)</tr>', html, re.DOTALL):
+        ver_match = re.search(r'<td[^>]*>\s*(v[\d\.]+)\s*</td>', row, re.IGNORECASE)
+        link_match = re.search(r'<a\s+href="([^"]+)"[^>]*>DOWNLOAD</a>', row, re.IGNORECASE)
+        if ver_match and link_match:
+            found.append([ver_match.group(1).strip(), link_match.group(1).strip()])
+    return found
+
+def regex_parse_fw(html):
+    found = []
+    for row in re.findall(r'<tr.*?>(.*?)</tr>', html, re.DOTALL):
+        ver_match = re.search(r'<td[^>]*>\s*(v[\d\.]+)\s*</td>', row, re.IGNORECASE)
+        if not ver_match: continue
+        links = re.findall(r'<a\s+href="([^"]+)"[^>]*>DOWNLOAD</a>', row, re.IGNORECASE)
+        if links: found.append([ver_match.group(1).strip(), links])
+    return found
+
+def chunks_of(body):
+    return (body[i:i + CHUNK] for i in range(0, len(body), CHUNK))
+
+def whole_body(body):
+    """What the old path did: join the download, decode it, then scan the full text"""
+    return b"".join(chunks_of(body)).decode('utf-8')
+
+def streamed_text(body):
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    return (decoder.decode(chunk) for chunk in chunks_of(body))
+
+def measure(fn, rounds):
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, best, peak
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--keys', help="saved keys index page (defaults to a synthetic fixture)")
+    ap.add_argument('--fw', help="saved firmware index page (defaults to a synthetic fixture)")
+    ap.add_argument('--rows', type=int, default=400)
+    ap.add_argument('--rounds', type=int, default=5)
+    args = ap.parse_args()
+
+    pages = {
+        'keys': open(args.keys, 'rb').read() if args.keys else make_keys_page(args.rows).encode(),
+        'fw': open(args.fw, 'rb').read() if args.fw else make_fw_page(args.rows).encode(),
+    }
+    parsers = {'keys': (regex_parse_keys, switch_core.parse_keys_page), 'fw': (regex_parse_fw, switch_core.parse_fw_page)}
+
+    print(f"{'page':<6}{'size':>10}{'rows':>7}{'regex ms':>11}{'stream ms':>11}{'regex peak':>12}{'stream peak':>13}")
+    for name, body in pages.items():
+        old, new = parsers[name]
+        old_rows, old_t, old_peak = measure(lambda: old(whole_body(body)), args.rounds)
+        new_rows, new_t, new_peak = measure(lambda: new(streamed_text(body)), args.rounds)
+        if old_rows != new_rows: print(f"  ! {name}: parsers disagree ({len(old_rows)} vs {len(new_rows)} rows)")
+        print(f"{name:<6}{len(body) / 1e6:>8.2f}MB{len(new_rows):>7}{old_t * 1000:>11.1f}{new_t * 1000:>11.1f}"
+              f"{old_peak / 1e6:>10.2f}MB{new_peak / 1e6:>11.2f}MB")
+
+if __name__ == '__main__':
+    main()
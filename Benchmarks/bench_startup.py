@@ -0,0 +1,58 @@
+"""
+Startup benchmark: launches the GUI with --profile-startup a few times and reports the median of every phase.
+
+Each run is a fresh interpreter, so 'wall' also includes Python's own startup. Runs against the real
+data folder unless --home points somewhere else (a fresh home measures the cold, no-cache start).
+Usage: py Benchmarks/bench_startup.py [--rounds 5] [--offscreen] [--home DIR] [--json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "Switch-Downloader.py")
+
+def run_once(env):
+    wall = time.perf_counter()
+    out = subprocess.run([sys.executable, APP, '--profile-startup'], env=env, capture_output=True, text=True, timeout=120)
+    wall = (time.perf_counter() - wall) * 1000
+    line = next((l for l in reversed(out.stdout.splitlines()) if l.startswith('{')), None)
+    if line is None: raise RuntimeError(f"no profile output:\n{out.stderr[-2000:]}")
+    report = json.loads(line)
+    report['wall_ms'] = round(wall, 2)
+    return report
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--rounds', type=int, default=5)
+    ap.add_argument('--offscreen', action='store_true', help="use Qt's offscreen platform (CI, no display)")
+    ap.add_argument('--home', help="run with this HOME / USERPROFILE instead of the real one")
+    ap.add_argument('--json', action='store_true', help="print the median report as one JSON line")
+    args = ap.parse_args()
+
+    env = dict(os.environ)
+    if args.offscreen: env['QT_QPA_PLATFORM'] = 'offscreen'
+    if args.home: env['HOME'] = env['USERPROFILE'] = os.path.abspath(args.home)
+
+    runs = [run_once(env) for _ in range(args.rounds)]
+    phases = list(runs[0]['at_ms'])
+    median = lambda key, phase: statistics.median(r[key][phase] for r in runs if r[key][phase] is not None) \
+        if any(r[key][phase] is not None for r in runs) else None
+    summary = {'rounds': len(runs), 'at_ms': {p: median('at_ms', p) for p in phases},
+               'phase_ms': {p: median('phase_ms', p) for p in phases},
+               'wall_ms': statistics.median(r['wall_ms'] for r in runs)}
+    if args.json:
+        print(json.dumps(summary))
+        return
+    print(f"{'phase':<15}{'at ms':>10}{'took ms':>10}")
+    for phase in phases:
+        at, took = summary['at_ms'][phase], summary['phase_ms'][phase]
+        print(f"{phase:<15}{'-' if at is None else f'{at:.1f}':>10}{'-' if took is None else f'{took:.1f}':>10}")
+    print(f"{'process wall':<15}{summary['wall_ms']:>10.1f}")
+
+if __name__ == '__main__':
+    main()
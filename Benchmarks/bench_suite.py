@@ -0,0 +1,157 @@
+"""
+End-to-end benchmark suite: the real scraper and download engine against the local stand-in server.
+
+Every scenario starts its own server (with the network conditions it needs) and runs in a fresh
+interpreter with a throwaway home folder, so peak RSS is per scenario and the user's settings,
+catalog cache and download manifest are never touched. Scraping drives ProdKeysScraper.fetch_data
+(cold, then revalidated); downloads drive the Downloader that the GUI's DownloadWorker wraps.
+
+Usage: py Benchmarks/bench_suite.py [--only ranged,resets] [--size-mb 128] [--rounds 2] [--connections 4] [--json]
+"""
+import argparse
+import codecs
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+sys.path.insert(0, os.path.dirname(HERE))
+from server import start_server
+
+# name: (kind, server flags, description)
+SCENARIOS = {
+    'scrape': ('scrape', [], "both index pages, cold then revalidated"),
+    'scrape-latency': ('scrape', ['--latency', '150'], "same with 150 ms per response"),
+    'ranged': ('download', [], "byte ranges on parallel connections"),
+    'single': ('download', ['--no-range'], "host without Range support"),
+    'latency': ('download', ['--latency', '50'], "50 ms before every response"),
+    'capped': ('download', ['--rate', '25'], "25 MB/s per connection"),
+    'resets': ('download', ['--reset-every', '24'], "a connection reset every 24 MiB"),
+    'install': ('download', [], "ranged, unpacked into an install folder"),
+}
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MiB"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 1024  # bytes on macOS, KiB elsewhere
+    except ImportError:
+        import ctypes
+        from ctypes import wintypes
+        class Counters(ctypes.Structure):
+            _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD)] + [(name, ctypes.c_size_t) for name in (
+                'PeakWorkingSetSize', 'WorkingSetSize', 'QuotaPeakPagedPoolUsage', 'QuotaPagedPoolUsage',
+                'QuotaPeakNonPagedPoolUsage', 'QuotaNonPagedPoolUsage', 'PagefileUsage', 'PeakPagefileUsage')]
+        counters = Counters()
+        counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb)
+        return counters.PeakWorkingSetSize / 2 ** 20
+
+def timed(fn):
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = fn()
+    return result, time.perf_counter() - wall, time.process_time() - cpu
+
+# --- CHILD SIDE (one scenario per interpreter) ---
+def run_scrape(core, base_url, args):
+    core.KEYS_URL, core.FW_URL = f"{base_url}/keys", f"{base_url}/fw"
+    scraper = core.ProdKeysScraper()
+    rows, cold, cold_cpu = timed(scraper.fetch_data)
+    pages = dict(scraper.page_timings)
+    _, warm, _ = timed(scraper.fetch_data)
+    parse = {}
+    for name, url, parse_page in (('keys', core.KEYS_URL, core.parse_keys_page), ('fw', core.FW_URL, core.parse_fw_page)):
+        body = core.http_client().get(url).content
+        chunks = lambda: (codecs.getincrementaldecoder('utf-8')().decode(body[i:i + 65536]) for i in range(0, len(body), 65536))
+        parse[name] = min(timed(lambda: parse_page(chunks()))[1] for _ in range(3)) * 1000
+    return {'rows': len(rows), 'cold_ms': cold * 1000, 'warm_ms': warm * 1000, 'cpu_s': cold_cpu,
+            'keys_page_ms': pages.get('Keys', 0) * 1000, 'fw_page_ms': pages.get('Firmware', 0) * 1000,
+            'parse_keys_ms': parse['keys'], 'parse_fw_ms': parse['fw']}
+
+def run_download(core, base_url, args):
+    core.DOWNLOAD_CONNECTIONS = args.connections
+    size = args.size_mb * 1024 * 1024
+    best = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for round_no in range(args.rounds):
+            save_path = os.path.join(tmp, f"Firmware_{round_no}.zip")
+            install = os.path.join(tmp, f"install_{round_no}") if args.scenario == 'install' else None
+            # A distinct URL per round, so the manifest does not hand back the previous round's file
+            engine = core.Downloader([(f"{base_url}/zip/{size}?round={round_no}", save_path)], [install])
+            result = []
+            engine.finished.connect(lambda success, msg: result.append((success, msg)))
+            _, wall, cpu = timed(engine.run)
+            if not result or not result[0][0]: raise RuntimeError(result[0][1] if result else "stopped")
+            total = os.path.getsize(save_path)
+            os.remove(save_path)
+            if best is None or wall < best[0]: best = (wall, cpu, total)
+    wall, cpu, total = best
+    stats = core.HTTP_STATS.snapshot()
+    return {'mb_per_s': total / wall / 1e6, 'wall_s': wall, 'cpu_s_per_gb': cpu / (total / 1e9),
+            'retries': stats['retries'], 'connections': stats['connections_opened']}
+
+def child(args):
+    import switch_core as core
+    runner = run_scrape if SCENARIOS[args.scenario][0] == 'scrape' else run_download
+    report = runner(core, args.base_url, args)
+    report['peak_rss_mb'] = peak_rss_mb()
+    print(json.dumps(report), flush=True)
+
+# --- PARENT SIDE ---
+def run_scenario(name, args):
+    kind, flags, _ = SCENARIOS[name]
+    proc, base_url = start_server(*flags, '--archive-mb', str(args.size_mb))
+    try:
+        with tempfile.TemporaryDirectory() as home:
+            env = dict(os.environ, HOME=home, USERPROFILE=home)
+            cmd = [sys.executable, os.path.abspath(__file__), '--child', name, '--base-url', base_url,
+                   '--size-mb', str(args.size_mb), '--rounds', str(args.rounds), '--connections', str(args.connections)]
+            out = subprocess.run(cmd, env=env, capture_output=True, text=True, timeout=args.timeout)
+    finally:
+        proc.terminate()
+    line = next((l for l in reversed(out.stdout.splitlines()) if l.startswith('{')), None)
+    if line is None: return {'error': (out.stderr.strip().splitlines() or ["no output"])[-1]}
+    return json.loads(line)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--only', help=f"comma separated scenarios ({', '.join(SCENARIOS)})")
+    ap.add_argument('--size-mb', type=int, default=128)
+    ap.add_argument('--rounds', type=int, default=2, help="download rounds per scenario (best is reported)")
+    ap.add_argument('--connections', type=int, default=4)
+    ap.add_argument('--timeout', type=int, default=600, help="seconds before a scenario is abandoned")
+    ap.add_argument('--json', action='store_true', help="print all results as one JSON line")
+    ap.add_argument('--child', dest='scenario', help=argparse.SUPPRESS)
+    ap.add_argument('--base-url', help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.scenario: return child(args)
+
+    names = args.only.split(',') if args.only else list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown: ap.error(f"unknown scenario(s): {', '.join(unknown)}")
+    results = {}
+    for name in names:
+        results[name] = run_scenario(name, args)
+        if not args.json: print_result(name, results[name])
+    if args.json: print(json.dumps(results))
+
+def print_result(name, r):
+    kind, _, description = SCENARIOS[name]
+    if 'error' in r: summary = f"FAILED: {r['error']}"
+    elif kind == 'scrape':
+        summary = (f"{r['rows']} rows | cold {r['cold_ms']:.0f} ms (keys {r['keys_page_ms']:.0f}, fw {r['fw_page_ms']:.0f}) | "
+                   f"revalidated {r['warm_ms']:.0f} ms | parse keys {r['parse_keys_ms']:.1f} ms, fw {r['parse_fw_ms']:.1f} ms | "
+                   f"CPU {r['cpu_s']:.2f} s")
+    else:
+        summary = (f"{r['mb_per_s']:.1f} MB/s | CPU {r['cpu_s_per_gb']:.2f} s/GB | {r['retries']} retries | "
+                   f"{r['connections']} connections")
+    rss = f" | peak RSS {r['peak_rss_mb']:.0f} MiB" if 'peak_rss_mb' in r else ""
+    print(f"{name:<15}{summary}{rss}\n{'':<15}({description})")
+
+if __name__ == '__main__':
+    main()
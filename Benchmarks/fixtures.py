@@ -0,0 +1,35 @@
+"""
+Synthetic stand-ins for the prodkeys.net index pages.
+
+Real saved copies can be used instead by passing their paths to the benchmarks.
+"""
+import random
+
+FILLER = ('<div class="entry-content"><p>Lorem ipsum dolor sit amet, consectetur adipiscing elit. '
+          '<a href="https://example.invalid/post">Read more</a></p>'
+          '<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script></div>\n')
+
+def _versions(count):
+    return [f"v{major}.{minor}.{patch}" for major in range(30, 0, -1)
+            for minor in range(5, -1, -1) for patch in range(3, -1, -1)][:count]
+
+def _page(title, rows, filler_blocks):
+    rng = random.Random(title)
+    head = FILLER * filler_blocks
+    body = "".join(rows)
+    tail = "".join(FILLER for _ in range(rng.randint(filler_blocks // 2, filler_blocks)))
+    return (f"<!DOCTYPE html><html><head><title>{title}</title></head><body>{head}"
+            f"<figure class=\"wp-block-table\"><table><thead><tr><th>Version</th><th>Link</th></tr></thead>"
+            f"<tbody>{body}</tbody></table></figure>{tail}</body></html>")
+
+def make_keys_page(rows=200, filler_blocks=2000, base_url="https://files.example.invalid"):
+    return _page("Prod Keys", [
+        f'<tr><td class="has-text-align-center">{ver}</td><td>Keys for {ver}</td>'
+        f'<td><a href="{base_url}/ProdKeys.net-{ver}.zip" target="_blank" rel="noreferrer noopener">DOWNLOAD</a></td></tr>\n'
+        for ver in _versions(rows)], filler_blocks)
+
+def make_fw_page(rows=200, filler_blocks=2000, base_url="https://files.example.invalid", mirrors=3):
+    return _page("Firmwares", [
+        f'<tr><td class="has-text-align-center">{ver}</td><td>Firmware {ver}</td><td>'
+        + " | ".join(f'<a href="{base_url}/m{m}/Firmware.{ver}.zip" target="_blank">DOWNLOAD</a>' for m in range(mirrors))
+        + '</td></tr>\n' for ver in _versions(rows)], filler_blocks)
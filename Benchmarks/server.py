@@ -0,0 +1,189 @@
+"""
+Stand-in HTTP server for the benchmarks.
+
+Serves synthetic data (with byte-range support) so scraping and downloads can be measured without
+touching the real hosts:
+    /blob/<bytes>    raw pattern bytes
+    /zip/<bytes>     a valid stored zip holding one member of that many pattern bytes
+    /keys, /fw       fixture copies of the two index pages (ETag / If-None-Match aware); their
+                     DOWNLOAD links point back here at zips of --archive-mb
+Network conditions can be simulated with --latency, --rate, --no-range and --reset-every.
+Run it standalone or through start_server().
+"""
+import argparse
+import hashlib
+import http.server
+import re
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+import zlib
+
+from fixtures import make_keys_page, make_fw_page
+
+PATTERN = bytes(range(256)) * 4096  # 1 MiB block the archives are built from
+MEMBER = b'blob.bin'
+PACED_WRITE = 64 * 1024
+
+def blob_slice(start, end):
+    """Bytes [start, end] of an endless repetition of PATTERN, produced one block at a time"""
+    pos = start
+    while pos <= end:
+        offset = pos % len(PATTERN)
+        piece = PATTERN[offset:offset + (end - pos + 1)]
+        yield piece
+        pos += len(piece)
+
+_crcs, _crc_lock = {}, threading.Lock()
+
+def blob_crc(size):
+    with _crc_lock:
+        if size not in _crcs:
+            crc = 0
+            for piece in blob_slice(0, size - 1): crc = zlib.crc32(piece, crc)
+            _crcs[size] = crc
+        return _crcs[size]
+
+def zip_parts(size):
+    """(head, tail, total length) of a stored zip whose only member is `size` pattern bytes (< 4 GiB)"""
+    crc = blob_crc(size)
+    head = struct.pack('<4sHHHHHIIIHH', b'PK\x03\x04', 20, 0, 0, 0, 0x21, crc, size, size, len(MEMBER), 0) + MEMBER
+    central = struct.pack('<4sHHHHHHIIIHHHHHII', b'PK\x01\x02', 20, 20, 0, 0, 0, 0x21, crc, size, size,
+                          len(MEMBER), 0, 0, 0, 0, 0, 0) + MEMBER
+    end = struct.pack('<4sHHHHIIH', b'PK\x05\x06', 0, 0, 1, 1, len(central), len(head) + size, 0)
+    return head, central + end, len(head) + size + len(central) + len(end)
+
+def zip_slice(size, start, end):
+    """Bytes [start, end] of the zip described by zip_parts(size), without ever building it"""
+    head, tail, total = zip_parts(size)
+    data_end = len(head) + size
+    if start < len(head): yield head[start:end + 1]
+    if end >= len(head) and start < data_end:
+        yield from blob_slice(max(start, len(head)) - len(head), min(end, data_end - 1) - len(head))
+    if end >= data_end: yield tail[max(start, data_end) - data_end:end + 1 - data_end]
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    latency = 0.0
+    rate = 0.0
+    ranges = True
+    reset_every = 0
+    archive_size = 64 * 1024 * 1024
+    rows = 200
+    pages = {}
+    sent, sent_lock = 0, threading.Lock()
+
+    def log_message(self, *args): pass
+
+    def do_HEAD(self): self.do_GET(head=True)
+
+    def do_GET(self, head=False):
+        if self.latency: time.sleep(self.latency)
+        path = self.path.split('?')[0]
+        if path in ('/keys', '/fw'):
+            self.send_page(path[1:], head)
+            return
+        if (match := re.match(r'/(blob|zip)/(\d+)$', path)): kind, size = match.group(1), int(match.group(2))
+        elif path.endswith('.zip'): kind, size = 'zip', self.archive_size
+        else:
+            self.send_error(404)
+            return
+        total = zip_parts(size)[2] if kind == 'zip' else size
+        start, end, status = 0, total - 1, 200
+        rng = re.match(r'bytes=(\d+)-(\d*)', self.headers.get('Range', '')) if self.ranges else None
+        if rng:
+            start = int(rng.group(1))
+            end = min(int(rng.group(2)), total - 1) if rng.group(2) else total - 1
+            status = 206
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/zip')
+        self.send_header('Content-Length', str(end - start + 1))
+        self.send_header('Accept-Ranges', 'bytes' if self.ranges else 'none')
+        self.send_header('ETag', f'"{kind}-{size}"')
+        if status == 206: self.send_header('Content-Range', f'bytes {start}-{end}/{total}')
+        self.end_headers()
+        if head: return
+        pieces = zip_slice(size, start, end) if kind == 'zip' else blob_slice(start, end)
+        try: self.send_body(pieces)
+        except (BrokenPipeError, ConnectionResetError): pass
+
+    def send_page(self, name, head):
+        if name not in self.pages:
+            base = f"http://{self.headers.get('Host')}"
+            html = (make_keys_page if name == 'keys' else make_fw_page)(self.rows, base_url=base).encode()
+            self.pages[name] = (html, '"' + hashlib.md5(html).hexdigest() + '"')
+        html, etag = self.pages[name]
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(html)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        if not head: self.send_body([html])
+
+    def send_body(self, pieces):
+        """Writes the body, paced to --rate per connection; every --reset-every bytes served (across all
+        connections) the current connection is reset mid-body"""
+        started, sent = time.monotonic(), 0
+        paced = self.rate or self.reset_every
+        for piece in pieces:
+            for i in range(0, len(piece), PACED_WRITE if paced else len(piece) or 1):
+                block = piece[i:i + PACED_WRITE] if paced else piece
+                if self.reset_every and self._count(len(block)):
+                    self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+                    self.connection.close()
+                    self.close_connection = True
+                    return
+                self.wfile.write(block)
+                sent += len(block)
+                if self.rate and (ahead := sent / self.rate - (time.monotonic() - started)) > 0: time.sleep(ahead)
+
+    @classmethod
+    def _count(cls, n):
+        with cls.sent_lock:
+            before, cls.sent = cls.sent, cls.sent + n
+            return before // cls.reset_every != cls.sent // cls.reset_every
+
+class Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address): pass
+
+def serve(args):
+    Handler.latency = args.latency / 1000
+    Handler.rate = args.rate * 1000000
+    Handler.ranges = not args.no_range
+    Handler.reset_every = int(args.reset_every * 1024 * 1024)
+    Handler.archive_size = int(args.archive_mb * 1024 * 1024)
+    Handler.rows = args.rows
+    server = Server(('127.0.0.1', args.port), Handler)
+    print(server.server_address[1], flush=True)
+    server.serve_forever()
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--port', type=int, default=0)
+    ap.add_argument('--latency', type=float, default=0, metavar='MS', help="delay before every response")
+    ap.add_argument('--rate', type=float, default=0, metavar='MBPS', help="bandwidth cap per connection in MB/s")
+    ap.add_argument('--no-range', action='store_true', help="ignore Range headers (always 200, Accept-Ranges: none)")
+    ap.add_argument('--reset-every', type=float, default=0, metavar='MB', help="reset a connection every N MiB served")
+    ap.add_argument('--archive-mb', type=float, default=64, help="size of the archives the index pages link to")
+    ap.add_argument('--rows', type=int, default=200, help="versions on each index page")
+    return ap.parse_args(argv)
+
+def start_server(*options):
+    """Runs the server in a child process (so its CPU time is not billed to the benchmark), passing
+    `options` as its command line flags. Returns (process, base_url)."""
+    proc = subprocess.Popen([sys.executable, __file__, *options], stdout=subprocess.PIPE, text=True)
+    port = int(proc.stdout.readline())
+    return proc, f"http://127.0.0.1:{port}"
+
+if __name__ == '__main__':
+    serve(parse_args())
@@ -3,27 +3,28 @@ Zuhu's Keys & Firmware Downloader V1.0.1
 
 By Zuhu | DC: ZuhuInc | DCS: https://discord.gg/Wr3wexQcD3
 """
+import time
+STARTUP_STARTED = time.perf_counter()
 import sys
 import os
-import requests
 import json
 import re
-import time
-import ctypes
-from plyer import notification
+import uuid
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import switch_core as core
+from switch_core import (DATA_FOLDER, ProdKeysScraper, Downloader, CatalogWatcher, load_settings, save_settings_to_file,
+                         is_catalog_fresh, format_speed, http_client)
 from PyQt6.QtWidgets import (QApplication, QWidget, QLabel, QVBoxLayout,
                              QHBoxLayout, QScrollArea, QStackedWidget, QPushButton,
                              QProgressBar, QLineEdit, QFormLayout, QFileDialog, 
-                             QCheckBox, QMessageBox, QFrame)
-from PyQt6.QtGui import QIcon, QFontDatabase, QFont, QPainter, QColor
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QObject, QThread, QTimer, QPropertyAnimation, QEasingCurve, pyqtProperty
+                             QCheckBox, QMessageBox, QFrame, QListView, QStyledItemDelegate, QSystemTrayIcon, QMenu)
+from PyQt6.QtGui import QIcon, QFontDatabase, QFont, QFontMetrics, QPainter, QPen, QColor, QDoubleValidator
+from PyQt6.QtCore import (Qt, QSize, QRect, QRectF, pyqtSignal, QObject, QThread, QTimer, QPropertyAnimation,
+                          QEasingCurve, pyqtProperty, QAbstractListModel, QModelIndex, QSortFilterProxyModel, QResource, QFile)
 
 # --- CONFIGURATION ---
 CURRENT_VERSION = "V1.0.1"
-KEYS_URL = "https://prodkeys.net/ryujinx-prod-keys-n25/#more-18"
-FW_URL = "https://prodkeys.net/latest-switch-firmwares-v16/"
-DATA_FOLDER = os.path.join(os.path.expanduser('~'), 'Documents', 'ZuhuProjects', 'ZuhuKeys')
-SETTINGS_FILE = os.path.join(DATA_FOLDER, 'Settings.json')
 ICON_URL = "https://raw.githubusercontent.com/ZuhuInc/Simple-NNTND-Switch-Downloader/refs/heads/main/Assets/NSPF-DWND-ICO.ico"
 SETTINGS_ICON_URL = "https://raw.githubusercontent.com/ZuhuInc/Simple-NNTND-Switch-Downloader/refs/heads/main/Assets/NSPF-STNG-ICO.ico"
 RELOAD_ICON_URL = "https://raw.githubusercontent.com/ZuhuInc/Simple-NNTND-Switch-Downloader/refs/heads/main/Assets/NSPF-RLD-ICO.ico"
@@ -32,9 +33,40 @@ ICON_PATH = os.path.join(DATA_FOLDER, 'cache', 'app_icon.ico')
 SETTINGS_ICON_PATH = os.path.join(DATA_FOLDER, 'cache', 'settings_icon.ico')
 RELOAD_ICON_PATH = os.path.join(DATA_FOLDER, 'cache', 'reload_icon.ico')
 FONT_PATH = os.path.join(DATA_FOLDER, 'cache', 'pixelmix.ttf')
-DEFAULT_DOWNLOAD_PATH = ""
-SHOW_SPEED_IN_MBPS = True
-ENABLE_NOTIFICATIONS = True
+ASSET_PACK_FILE = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__))), 'Assets.rcc')
+BUNDLED_ASSETS = {'icon': 'NSPF-DWND-ICO.ico', 'settings_icon': 'NSPF-STNG-ICO.ico', 'reload_icon': 'NSPF-RLD-ICO.ico', 'font': 'pixelmix.ttf'}
+ASSET_FAILURES_FILE = os.path.join(DATA_FOLDER, 'cache', 'asset_failures.json')
+ASSET_RETRY_AFTER = 24 * 60 * 60
+ASSET_DEADLINE = 15
+QUEUE_FILE = os.path.join(DATA_FOLDER, 'Queue.json')
+SEARCH_DEBOUNCE_MS = 150
+PROFILE_TIMEOUT_MS = 30000
+
+# --- STARTUP PROFILER ---
+class StartupProfile:
+    """Milliseconds from script start to each startup phase, printed as JSON by --profile-startup.
+    Only the first mark of a phase counts, so the calls can stay on hot paths like paint()."""
+    PHASES = ('import', 'qt_app', 'assets', 'settings', 'init_ui', 'first_paint', 'first_catalog')
+
+    def __init__(self, started):
+        self.started = started
+        self.marks = {}
+
+    def mark(self, phase):
+        if phase not in self.marks: self.marks[phase] = round((time.perf_counter() - self.started) * 1000, 2)
+
+    def complete(self):
+        return all(phase in self.marks for phase in self.PHASES)
+
+    def report(self):
+        """{"at_ms": cumulative marks, "phase_ms": time spent since the previous mark}; missing phases are null"""
+        at = {phase: self.marks.get(phase) for phase in self.PHASES}
+        phase_ms, last = {}, 0.0
+        for phase, ms in sorted(self.marks.items(), key=lambda kv: kv[1]):
+            phase_ms[phase], last = round(ms - last, 2), ms
+        return {'version': CURRENT_VERSION, 'at_ms': at, 'phase_ms': {p: phase_ms.get(p) for p in self.PHASES}}
+
+STARTUP_PROFILE = StartupProfile(STARTUP_STARTED)
 
 # --- STYLING ---
 STYLESHEET = """
@@ -92,27 +124,6 @@ STYLESHEET = """
     QPushButton#TopBackBtn:hover { color: #fff; }
 """
 
-# --- SETTINGS MANAGER ---
-def load_settings():
-    global DEFAULT_DOWNLOAD_PATH, SHOW_SPEED_IN_MBPS, ENABLE_NOTIFICATIONS
-    if os.path.exists(SETTINGS_FILE):
-        try:
-            with open(SETTINGS_FILE, 'r') as f:
-                settings = json.load(f)
-                DEFAULT_DOWNLOAD_PATH = settings.get('default_download_path', DEFAULT_DOWNLOAD_PATH)
-                SHOW_SPEED_IN_MBPS = settings.get('show_speed_in_mbps', False)
-                ENABLE_NOTIFICATIONS = settings.get('enable_notifications', True)
-        except: pass
-
-def save_settings_to_file():
-    os.makedirs(DATA_FOLDER, exist_ok=True)
-    settings = {
-        'default_download_path': DEFAULT_DOWNLOAD_PATH,
-        'show_speed_in_mbps': SHOW_SPEED_IN_MBPS,
-        'enable_notifications': ENABLE_NOTIFICATIONS
-    }
-    with open(SETTINGS_FILE, 'w') as f: json.dump(settings, f, indent=4)
-
 # --- CUSTOM TOGGLE ---
 class PyToggle(QCheckBox):
     def __init__(self, parent=None):
@@ -147,131 +158,644 @@ class PyToggle(QCheckBox):
     def set_cp(self, pos): self._circle_position = pos; self.update()
     circle_position = pyqtProperty(float, get_cp, set_cp)
 
-# --- SCRAPER ENGINE ---
-class ProdKeysScraper(QObject):
-    status_update = pyqtSignal(str)
-    
-    def fetch_data(self):
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        merged_data = {}
-        self.status_update.emit("Fetching Keys...")
-        try:
-            r = requests.get(KEYS_URL, headers=headers, timeout=15)
-            if r.status_code == 200:
-                rows = re.findall(r'<tr.*?>(.*?)</tr>', r.text, re.DOTALL)
-                for row in rows:
-                    ver_match = re.search(r'<td[^>]*>\s*(v[\d\.]+)\s*</td>', row, re.IGNORECASE)
-                    link_match = re.search(r'<a\s+href="([^"]+)"[^>]*>DOWNLOAD</a>', row, re.IGNORECASE)
-                    if ver_match and link_match:
-                        ver = ver_match.group(1).strip()
-                        if ver not in merged_data: merged_data[ver] = {'version': ver}
-                        merged_data[ver]['keys_url'] = link_match.group(1).strip()
-        except Exception as e: print(f"Keys Error: {e}")
-
-        self.status_update.emit("Fetching Firmware...")
-        try:
-            r = requests.get(FW_URL, headers=headers, timeout=15)
-            if r.status_code == 200:
-                rows = re.findall(r'<tr.*?>(.*?)</tr>', r.text, re.DOTALL)
-                for row in rows:
-                    ver_match = re.search(r'<td[^>]*>\s*(v[\d\.]+)\s*</td>', row, re.IGNORECASE)
-                    if not ver_match: continue
-                    ver = ver_match.group(1).strip()
-                    links = re.findall(r'<a\s+href="([^"]+)"[^>]*>DOWNLOAD</a>', row, re.IGNORECASE)
-                    if links:
-                        norm_ver = ver.replace('V', 'v')
-                        target_key = next((k for k in merged_data if k.lower() == norm_ver.lower()), norm_ver)
-                        if target_key not in merged_data: merged_data[target_key] = {'version': target_key}
-                        merged_data[target_key]['fw_url'] = links[0]
-        except Exception as e: print(f"FW Error: {e}")
-
-        def sort_key(item):
-            v_str = item['version'].lower().replace('v', '')
-            try: return [int(x) for x in v_str.split('.')]
-            except: return [0]
-
-        final_list = sorted(merged_data.values(), key=sort_key, reverse=True)
-        self.status_update.emit("Ready")
-        return final_list
-
 # --- DOWNLOAD WORKER ---
 class DownloadWorker(QThread):
+    """Runs a core Downloader on its own thread and re-emits its callbacks as Qt signals"""
     progress = pyqtSignal(int, str)
+    task_progress = pyqtSignal(int, int, str)
     finished = pyqtSignal(bool, str)
+    stopped = pyqtSignal()
+
+    def __init__(self, download_tasks, install_dirs=None):
+        super().__init__()
+        self.engine = Downloader(download_tasks, install_dirs)
+        self.engine.progress.connect(self.progress.emit)
+        self.engine.task_progress.connect(self.task_progress.emit)
+        self.engine.finished.connect(self.finished.emit)
+        self.engine.stopped.connect(self.stopped.emit)
+
+    def run(self):
+        self.engine.run()
+
+    def stop(self):
+        self.engine.is_running = False
+
+# --- CATALOG WORKER ---
+class CatalogWorker(QThread):
+    """Loads the catalog with its own ProdKeysScraper on its own thread, so a newer reload can supersede it.
+    rows_ready carries partial catalogs while the pages are parsed, loaded the final one (not after cancel())."""
+    rows_ready = pyqtSignal(list)
+    loaded = pyqtSignal(list)
+
+    def __init__(self):
+        super().__init__()
+        self.scraper = ProdKeysScraper()
+        self.scraper.rows_ready.connect(self.rows_ready.emit)
+
+    def run(self):
+        data = self.scraper.fetch_data()
+        if data is not None and not self.scraper.cancelled.is_set(): self.loaded.emit(data)
+
+    def cancel(self):
+        self.scraper.cancel()
+
+class WatchWorker(QThread):
+    """Runs a core.CatalogWatcher (watch mode) until stop(); changed only fires when a release appeared or changed"""
+    changed = pyqtSignal(dict)
+    status = pyqtSignal(str)
+
+    def __init__(self, busy=None):
+        super().__init__()
+        self.watcher = CatalogWatcher(busy)
+        self.watcher.changed.connect(self.changed.emit)
+        self.watcher.status.connect(self.status.emit)
+
+    def run(self):
+        self.watcher.run()
+
+    def stop(self):
+        self.watcher.stop()
+
+# --- DOWNLOAD MANAGER ---
+class DownloadManager(QObject):
+    """Persistent download queue: runs up to core.MAX_PARALLEL_DOWNLOADS jobs at once, one DownloadWorker per file.
+    Jobs start in queue order; a job's priority only decides where it is inserted."""
+    queue_changed = pyqtSignal()
+    job_progress = pyqtSignal(str, int, str)
+    progress = pyqtSignal(int, str)
+    all_finished = pyqtSignal(bool, str)
+
+    ACTIVE = ('queued', 'running', 'paused')
+
+    def __init__(self):
+        super().__init__()
+        self.jobs = []
+        self.workers = {}
+        self.errors = []
+        self.completed = 0
+        self.load()
+
+    def load(self):
+        """Restores the saved queue; anything that was running or waiting comes back paused"""
+        try:
+            with open(QUEUE_FILE, 'r') as f: saved = json.load(f)
+        except: saved = []
+        for job in saved:
+            if job.get('state') in self.ACTIVE:
+                job.update(state='paused', text="Paused")
+                self.jobs.append(job)
+
+    def save(self):
+        os.makedirs(DATA_FOLDER, exist_ok=True)
+        tmp_path = QUEUE_FILE + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump([job for job in self.jobs if job['state'] in self.ACTIVE], f, indent=4)
+        os.replace(tmp_path, QUEUE_FILE)
+
+    def _changed(self):
+        try: self.save()
+        except Exception as e: print(f"Queue Error: {e}")
+        self.queue_changed.emit()
+
+    def busy(self):
+        """True while any job is queued or a worker is still running; safe to call from the watch thread"""
+        return bool(self.workers) or any(job['state'] == 'queued' for job in list(self.jobs))
+
+    def job(self, job_id):
+        return next((job for job in self.jobs if job['id'] == job_id), None)
+
+    def enqueue(self, url, save_path, priority=0, install_dir=""):
+        """Adds a file to the queue; returns False if the same target is already queued or running"""
+        if any(job['save_path'] == save_path and job['state'] in self.ACTIVE for job in self.jobs): return False
+        job = {'id': uuid.uuid4().hex, 'url': url, 'save_path': save_path, 'name': os.path.basename(save_path),
+               'priority': priority, 'install_dir': install_dir, 'state': 'queued', 'percent': 0, 'text': "Queued"}
+        index = next((i for i, other in enumerate(self.jobs)
+                      if other['state'] == 'queued' and other['priority'] < priority), len(self.jobs))
+        self.jobs.insert(index, job)
+        self._changed()
+        self.schedule()
+        return True
+
+    def schedule(self):
+        # A paused or cancelled worker keeps its slot (and its .part file) until it has actually stopped
+        waiting = [job for job in self.jobs if job['state'] == 'queued' and job['id'] not in self.workers]
+        for job in waiting[:max(0, core.MAX_PARALLEL_DOWNLOADS - len(self.workers))]: self._start(job)
+
+    def _start(self, job):
+        job.update(state='running', text="Starting...")
+        worker = DownloadWorker([(job['url'], job['save_path'])], [job.get('install_dir')])
+        worker.progress.connect(partial(self._on_progress, job['id']))
+        worker.finished.connect(partial(self._on_finished, job['id']))
+        worker.stopped.connect(partial(self._on_stopped, job['id']))
+        self.workers[job['id']] = worker
+        worker.start()
+        self._changed()
+
+    def _on_progress(self, job_id, percent, text):
+        job = self.job(job_id)
+        if not job or job['state'] != 'running': return
+        job.update(percent=percent, text=text)
+        self.job_progress.emit(job_id, percent, text)
+
+        running = [job for job in self.jobs if job['state'] == 'running']
+        if len(running) == 1:
+            self.progress.emit(percent, text)
+            return
+        done = total = speed = 0
+        for job in running:
+            if (worker := self.workers.get(job['id'])):
+                with worker.engine.stats_lock: st = dict(worker.engine.stats[0])
+                done, total, speed = done + st['done'], total + st['total'], speed + st['speed']
+        overall = int((done / total) * 100) if total else 0
+        self.progress.emit(overall, f"Downloading {len(running)} files | {overall}% | {format_speed(speed)}")
 
-    def __init__(self, download_tasks):
+    def _on_finished(self, job_id, success, msg):
+        """A worker can finish just as its job is paused or cancelled; the user's choice wins over the result"""
+        self.workers.pop(job_id, None)
+        job = self.job(job_id)
+        if job and job['state'] == 'cancelled': self._discard_partial(job)
+        elif job and job['state'] != 'paused':
+            if success:
+                job.update(state='done', percent=100, text="Installed" if job.get('install_dir') else "Complete")
+                self.completed += 1
+            else:
+                job.update(state='failed', text=msg)
+                self.errors.append(f"{job['name']}: {msg}")
+        self._after_job()
+
+    def _on_stopped(self, job_id):
+        self.workers.pop(job_id, None)
+        job = self.job(job_id)
+        if job and job['state'] == 'cancelled': self._discard_partial(job)
+        self._after_job()
+
+    def _after_job(self):
+        self._changed()
+        self.schedule()
+        if not any(job['state'] in ('queued', 'running') for job in self.jobs):
+            if self.errors: self.all_finished.emit(False, f"Failed: {'; '.join(self.errors)}")
+            elif self.completed: self.all_finished.emit(True, "All Downloads Complete")
+            self.errors, self.completed = [], 0
+
+    def _discard_partial(self, job):
+        for path in (job['save_path'] + '.part', job['save_path'] + '.part.json'):
+            try: os.remove(path)
+            except FileNotFoundError: pass
+
+    def pause(self, job_id):
+        """Stops the transfer but keeps the .part file and journal so it resumes later"""
+        job = self.job(job_id)
+        if not job or job['state'] not in ('queued', 'running'): return
+        job.update(state='paused', text="Paused")
+        if (worker := self.workers.get(job_id)): worker.stop()
+        self._changed()
+
+    def resume(self, job_id):
+        job = self.job(job_id)
+        if not job or job['state'] not in ('paused', 'failed'): return
+        job.update(state='queued', text="Queued")
+        self._changed()
+        self.schedule()
+
+    def cancel(self, job_id):
+        job = self.job(job_id)
+        if not job or job['state'] not in self.ACTIVE + ('failed',): return
+        job.update(state='cancelled', text="Cancelled")
+        if (worker := self.workers.get(job_id)): worker.stop()
+        else: self._discard_partial(job)
+        self._changed()
+
+    def move(self, job_id, offset):
+        """Shifts a job up (negative) or down (positive) in the queue order"""
+        job = self.job(job_id)
+        if not job: return
+        index = self.jobs.index(job)
+        new_index = min(max(index + offset, 0), len(self.jobs) - 1)
+        self.jobs.insert(new_index, self.jobs.pop(index))
+        self._changed()
+
+    def clear_finished(self):
+        self.jobs = [job for job in self.jobs if job['state'] in self.ACTIVE or job['id'] in self.workers]
+        self._changed()
+
+    def shutdown(self):
+        """Stops every transfer on exit; their journals let them resume on the next launch"""
+        for worker in list(self.workers.values()): worker.stop()
+        for worker in list(self.workers.values()): worker.wait(3000)
+        try: self.save()
+        except Exception as e: print(f"Queue Error: {e}")
+
+# --- ASSET LOADER ---
+def asset_sources():
+    """name -> (label, url, cache path) of every downloadable asset"""
+    return {'icon': ("App Icon", ICON_URL, ICON_PATH),
+            'settings_icon': ("Settings Icon", SETTINGS_ICON_URL, SETTINGS_ICON_PATH),
+            'reload_icon': ("Reload Icon", RELOAD_ICON_URL, RELOAD_ICON_PATH),
+            'font': ("Font", FONT_URL, FONT_PATH)}
+
+def load_asset_pack():
+    """Maps Assets.rcc (built by build_assets.py) into the :/assets resource tree; False if it isn't shipped"""
+    return os.path.exists(ASSET_PACK_FILE) and QResource.registerResource(ASSET_PACK_FILE)
+
+def asset_path(name):
+    """A file in the cache folder overrides the bundled copy; None means the asset has to be downloaded"""
+    path = asset_sources()[name][2]
+    if os.path.exists(path): return path
+    bundled = ':/assets/' + BUNDLED_ASSETS[name]
+    return bundled if QFile.exists(bundled) else None
+
+def notification_icon():
+    """plyer only shows an icon from a real file, so the bundled one is copied into the cache once; None without either"""
+    if not os.path.exists(ICON_PATH) and (bundled := asset_path('icon')):
+        source = QFile(bundled)
+        if source.open(QFile.OpenModeFlag.ReadOnly):
+            with open(ICON_PATH, 'wb') as f: f.write(bytes(source.readAll()))
+    return ICON_PATH if os.path.exists(ICON_PATH) else None
+
+def load_asset_failures():
+    try:
+        with open(ASSET_FAILURES_FILE, 'r') as f: return json.load(f)
+    except: return {}
+
+def fetch_asset(url, path):
+    r = http_client().get(url, deadline=ASSET_DEADLINE)
+    r.raise_for_status()
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f: f.write(r.content)
+    os.replace(tmp_path, path)
+
+class AssetFetcher(QThread):
+    """Downloads the missing assets side by side, off the GUI thread. An asset that failed is not retried
+    for ASSET_RETRY_AFTER, so an offline machine does not pay the timeouts on every launch."""
+    asset_ready = pyqtSignal(str, str)
+
+    def __init__(self, missing):
         super().__init__()
-        self.tasks = download_tasks
-        self.is_running = True
+        self.missing = missing
 
     def run(self):
-        for i, (url, save_path) in enumerate(self.tasks):
-            if not self.is_running: break
-            filename = os.path.basename(save_path)
-            self.progress.emit(0, f"Starting {filename}...")
-            try:
-                response = requests.get(url, stream=True, timeout=30)
-                response.raise_for_status()
-                total_length = int(response.headers.get('content-length', 0))
-                dl = 0
-                start_time = time.time()
-                with open(save_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if not self.is_running: break
-                        if chunk:
-                            f.write(chunk)
-                            dl += len(chunk)
-                            if total_length > 0:
-                                percent = int((dl / total_length) * 100)
-                                elapsed = time.time() - start_time
-                                speed = (dl / elapsed) if elapsed > 0 else 0
-                                speed_str = f"{(speed * 8) / 1000000:.1f} Mbps" if SHOW_SPEED_IN_MBPS else f"{speed / 1000000:.1f} MB/s"
-                                self.progress.emit(percent, f"Downloading {filename} | {percent}% | {speed_str}")
-                if self.is_running: self.progress.emit(100, f"{filename} Complete")
-            except Exception as e:
-                self.finished.emit(False, f"Failed: {str(e)}")
-                return
-        if self.is_running: self.finished.emit(True, "All Downloads Complete")
+        failures = load_asset_failures()
+        todo = {name: src for name, src in self.missing.items()
+                if time.time() - failures.get(src[1], 0) > ASSET_RETRY_AFTER}
+        if not todo: return
+        with ThreadPoolExecutor(max_workers=len(todo)) as pool:
+            jobs = {pool.submit(fetch_asset, url, path): (name, label, url, path) for name, (label, url, path) in todo.items()}
+            for job in as_completed(jobs):
+                name, label, url, path = jobs[job]
+                try:
+                    job.result()
+                    failures.pop(url, None)
+                    self.asset_ready.emit(name, path)
+                except Exception as e:
+                    print(f"Failed {label}: {e}")
+                    failures[url] = time.time()
+        try:
+            with open(ASSET_FAILURES_FILE, 'w') as f: json.dump(failures, f)
+        except Exception as e: print(f"Cache Error: {e}")
 
 # --- WIDGETS ---
-class VersionRowWidget(QWidget):
-    download_requested = pyqtSignal(str, dict) 
-    def __init__(self, data, font):
+class VersionListModel(QAbstractListModel):
+    """The merged catalog; DisplayRole is the version string, UserRole the whole entry"""
+    def __init__(self):
+        super().__init__()
+        self.items = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid(): return None
+        item = self.items[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole: return item['version']
+        if role == Qt.ItemDataRole.UserRole: return item
+        return None
+
+    def set_items(self, items):
+        self.beginResetModel()
+        self.items = list(items)
+        self.endResetModel()
+
+    def touch_rows(self, first, last):
+        """Asks views and proxies to look at rows first..last again (VersionFilterProxy re-filters just those)"""
+        self.dataChanged.emit(self.index(first), self.index(last))
+
+class VersionSearchIndex:
+    """Built once per catalog load so a query is a few lookups instead of a scan and a rebuild.
+    Understands plain text (prefix, then substring), comparisons like `>=17` or `<18.1`, wildcards like `18.x`
+    and `latest`; space separated terms must all match. query() returns the matching source rows."""
+    COMPARE_RE = re.compile(r'^(>=|<=|==|=|>|<)v?(\d+(?:\.\d+)*)$')
+    WILDCARD_RE = re.compile(r'^v?(\d+(?:\.\d+)*)\.[x*]$')
+
+    def __init__(self, items):
+        self.rows = set(range(len(items)))
+        self.texts = [item['version'].lower().lstrip('v') for item in items]
+        self.parts = [tuple(int(x) for x in re.findall(r'\d+', text)) for text in self.texts]
+        self.prefixes = {}
+        for row, text in enumerate(self.texts):
+            for end in range(1, len(text) + 1): self.prefixes.setdefault(text[:end], set()).add(row)
+        self.latest = {max(self.rows, key=lambda row: self.parts[row])} if items else set()
+
+    def query(self, text):
+        rows = set(self.rows)
+        for term in text.lower().replace(',', ' ').split():
+            rows &= self._term(term)
+            if not rows: break
+        return rows
+
+    def _term(self, term):
+        if term == 'latest': return self.latest
+        if (match := self.COMPARE_RE.match(term)):
+            op, bound = match.group(1), tuple(int(x) for x in match.group(2).split('.'))
+            return {row for row in self.rows if self._compare(self.parts[row][:len(bound)], op, bound)}
+        if (match := self.WILDCARD_RE.match(term)):
+            bound = tuple(int(x) for x in match.group(1).split('.'))
+            return {row for row in self.rows if self.parts[row][:len(bound)] == bound}
+        if re.match(r'v[\d.]*$', term): term = term[1:]
+        if not term: return self.rows
+        if term in self.prefixes: return self.prefixes[term]
+        return {row for row, text in enumerate(self.texts) if term in text}
+
+    @staticmethod
+    def _compare(head, op, bound):
+        if op in ('=', '=='): return head == bound
+        if op == '>=': return head >= bound
+        if op == '<=': return head <= bound
+        return head > bound if op == '>' else head < bound
+
+class VersionFilterProxy(QSortFilterProxyModel):
+    """Shows exactly the source rows handed to set_rows(). Only rows whose visibility changed are re-filtered:
+    the source VersionListModel's touch_rows() announces each contiguous run of them, which the (dynamic) proxy
+    answers by re-checking just that run. Past MAX_RUNS runs a single full re-filter is cheaper."""
+    MAX_RUNS = 32
+
+    def __init__(self):
+        super().__init__()
+        self.visible = None
+
+    def set_rows(self, rows):
+        """Returns the (added, removed) source rows relative to what was shown before"""
+        before = self.visible if self.visible is not None else set(range(self.sourceModel().rowCount()))
+        added, removed = rows - before, before - rows
+        self.visible = rows
+        runs = self._runs(sorted(added | removed))
+        if len(runs) > self.MAX_RUNS: self.invalidateRowsFilter()
+        else:
+            for first, last in runs: self.sourceModel().touch_rows(first, last)
+        return added, removed
+
+    @staticmethod
+    def _runs(changed):
+        runs = []
+        for row in changed:
+            if runs and runs[-1][1] == row - 1: runs[-1][1] = row
+            else: runs.append([row, row])
+        return runs
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self.visible is None or source_row in self.visible
+
+class VersionRowDelegate(QStyledItemDelegate):
+    """Paints a version row (name on the left, download buttons on the right); nothing is a real widget"""
+    ROW_HEIGHT = 60
+    ACTIONS = (('keys', "Download Keys"), ('fw', "Download Firmware"), ('both', "Download Both"))
+
+    def __init__(self, font, parent=None):
+        super().__init__(parent)
+        self.hover = None
+        self.set_font(font)
+
+    def set_font(self, font):
+        self.ver_font = QFont(font)
+        self.ver_font.setPixelSize(14)
+        self.ver_font.setBold(True)
+        self.btn_font = QFont(font)
+        self.btn_font.setBold(True)
+        metrics = QFontMetrics(self.btn_font)
+        self.btn_height = metrics.height() + 12
+        self.btn_widths = {text: metrics.horizontalAdvance(text) + 26 for _, text in self.ACTIONS}
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def button_rects(self, rect, item):
+        """(action, text, QRect) for each button of the row, laid out right to left"""
+        has_keys, has_fw = 'keys_url' in item, 'fw_url' in item
+        shown = [(a, t) for a, t in self.ACTIONS
+                 if (a == 'keys' and has_keys) or (a == 'fw' and has_fw) or (a == 'both' and has_keys and has_fw)]
+        rects, right = [], rect.right() - 30
+        top = rect.top() + (rect.height() - self.btn_height) // 2
+        for action, text in reversed(shown):
+            width = self.btn_widths[text]
+            rects.append((action, text, QRect(right - width, top, width, self.btn_height)))
+            right -= width + 15
+        return rects[::-1]
+
+    def paint(self, painter, option, index):
+        STARTUP_PROFILE.mark('first_catalog')
+        item = index.data(Qt.ItemDataRole.UserRole)
+        rect = option.rect
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        painter.setFont(self.ver_font)
+        painter.setPen(QColor("#00ff7f"))
+        painter.drawText(rect.adjusted(20, 0, 0, 0), Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, item['version'])
+
+        painter.setFont(self.btn_font)
+        for action, text, btn in self.button_rects(rect, item):
+            hovered = self.hover == (index.row(), action)
+            if action == 'both':
+                border, color, fill = "#00ff7f", "#00ff7f", QColor(0, 255, 127, 51 if hovered else 13)
+            elif hovered:
+                border, color, fill = "#00ff7f", "#00ff7f", QColor(0, 255, 127, 13)
+            else:
+                border, color, fill = "#666", "#ccc", None
+            painter.setPen(QPen(QColor(border), 1))
+            painter.setBrush(fill if fill else Qt.BrushStyle.NoBrush)
+            painter.drawRoundedRect(QRectF(btn).adjusted(0.5, 0.5, -0.5, -0.5), 6, 6)
+            painter.setPen(QColor(color))
+            painter.drawText(btn, Qt.AlignmentFlag.AlignCenter, text)
+
+        painter.setPen(QColor("#333"))
+        painter.drawLine(rect.left(), rect.bottom(), rect.right(), rect.bottom())
+        painter.restore()
+
+class VersionListView(QListView):
+    """Only the visible rows are ever painted; clicks are hit-tested against the delegate's button layout"""
+    download_requested = pyqtSignal(str, dict)
+
+    def __init__(self, font):
+        super().__init__()
+        self.delegate = VersionRowDelegate(font, self)
+        self.setItemDelegate(self.delegate)
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setStyleSheet("QListView { border: none; background-color: #1e1e1e; }")
+
+    def _hit(self, pos):
+        index = self.indexAt(pos)
+        if not index.isValid(): return index, None
+        for action, _, rect in self.delegate.button_rects(self.visualRect(index), index.data(Qt.ItemDataRole.UserRole)):
+            if rect.contains(pos): return index, action
+        return index, None
+
+    def _set_hover(self, hover):
+        if hover == self.delegate.hover: return
+        self.delegate.hover = hover
+        self.viewport().setCursor(Qt.CursorShape.PointingHandCursor if hover else Qt.CursorShape.ArrowCursor)
+        self.viewport().update()
+
+    def mouseMoveEvent(self, e):
+        index, action = self._hit(e.position().toPoint())
+        self._set_hover((index.row(), action) if action else None)
+        super().mouseMoveEvent(e)
+
+    def leaveEvent(self, e):
+        self._set_hover(None)
+        super().leaveEvent(e)
+
+    def mouseReleaseEvent(self, e):
+        if e.button() == Qt.MouseButton.LeftButton:
+            index, action = self._hit(e.position().toPoint())
+            if action: self.download_requested.emit(action, index.data(Qt.ItemDataRole.UserRole))
+        super().mouseReleaseEvent(e)
+
+    def clear_hover(self):
+        self._set_hover(None)
+
+    def set_font(self, font):
+        self.delegate.set_font(font)
+        self.scheduleDelayedItemsLayout()
+        self.viewport().update()
+
+class TaskProgressRow(QWidget):
+    """One line per running file while several download at once: a slim bar next to the file's own status"""
+    def __init__(self, font):
+        super().__init__()
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+
+        self.bar = QProgressBar()
+        self.bar.setFixedSize(120, 6)
+        self.bar.setTextVisible(False)
+
+        self.label = QLabel()
+        self.label.setFont(font)
+        self.label.setStyleSheet("color: #888; font-size: 10px;")
+
+        layout.addWidget(self.bar)
+        layout.addWidget(self.label)
+        layout.addStretch()
+
+    def set_progress(self, percent, text):
+        if percent >= 0: self.bar.setValue(percent)
+        self.label.setText(text)
+
+class QueueRowWidget(QWidget):
+    def __init__(self, job, manager, font):
         super().__init__()
-        self.data = data
         self.setFixedHeight(60)
         layout = QHBoxLayout(self)
         layout.setContentsMargins(20, 5, 30, 5)
-        layout.setSpacing(15)
+        layout.setSpacing(10)
 
-        lbl_ver = QLabel(data['version'])
-        lbl_ver.setFont(font)
-        lbl_ver.setStyleSheet("font-size: 14px; font-weight: bold; color: #00ff7f;")
-        layout.addWidget(lbl_ver)
+        info = QVBoxLayout()
+        info.setSpacing(2)
+        lbl_name = QLabel(job['name'])
+        lbl_name.setFont(font)
+        lbl_name.setStyleSheet("font-size: 13px; font-weight: bold; color: #00ff7f;")
+        self.lbl_status = QLabel(job['text'])
+        self.lbl_status.setFont(font)
+        self.lbl_status.setStyleSheet("color: #888; font-size: 10px;")
+        self.bar = QProgressBar()
+        self.bar.setFixedSize(260, 6)
+        self.bar.setTextVisible(False)
+        self.bar.setValue(job['percent'])
+        info.addWidget(lbl_name)
+        info.addWidget(self.bar)
+        info.addWidget(self.lbl_status)
+        layout.addLayout(info)
         layout.addStretch()
 
-        has_keys, has_fw = 'keys_url' in data, 'fw_url' in data
-        if has_keys: self._add_btn(layout, "Download Keys", 'keys', font)
-        if has_fw: self._add_btn(layout, "Download Firmware", 'fw', font)
-        if has_keys and has_fw: self._add_btn(layout, "Download Both", 'both', font, True)
+        job_id, state = job['id'], job['state']
+        self._add_btn(layout, "▲", "Move up", font, lambda: manager.move(job_id, -1))
+        self._add_btn(layout, "▼", "Move down", font, lambda: manager.move(job_id, 1))
+        if state in ('queued', 'running'): self._add_btn(layout, "Pause", "Pause", font, lambda: manager.pause(job_id))
+        elif state in ('paused', 'failed'): self._add_btn(layout, "Resume", "Resume", font, lambda: manager.resume(job_id))
+        if state in DownloadManager.ACTIVE + ('failed',):
+            self._add_btn(layout, "Cancel", "Cancel and delete the partial file", font, lambda: manager.cancel(job_id))
 
         self.line = QFrame(self)
         self.line.setGeometry(0, 59, 2000, 1)
         self.line.setStyleSheet("background-color: #333;")
 
-    def _add_btn(self, layout, text, action, font, is_both=False):
+    def _add_btn(self, layout, text, tip, font, action):
         btn = QPushButton(text)
         btn.setFont(font)
+        btn.setToolTip(tip)
         btn.setProperty("class", "actionBtn")
-        if is_both:
-            btn.setStyleSheet("""
-                QPushButton { border: 1px solid #00ff7f; color: #00ff7f; background-color: rgba(0,255,127,0.05); }
-                QPushButton:hover { background-color: rgba(0,255,127,0.2); }
-            """)
-        btn.clicked.connect(lambda: self.download_requested.emit(action, self.data))
+        btn.clicked.connect(action)
         layout.addWidget(btn)
 
+    def set_progress(self, percent, text):
+        if percent >= 0: self.bar.setValue(percent)
+        self.lbl_status.setText(text)
+
+class DownloadsPage(QWidget):
+    def __init__(self, manager, font):
+        super().__init__()
+        self.manager, self.row_font = manager, font
+        self.rows = {}
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.scroll = QScrollArea()
+        self.scroll.setWidgetResizable(True)
+        self.list_container = QWidget()
+        self.list_vbox = QVBoxLayout(self.list_container)
+        self.list_vbox.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self.scroll.setWidget(self.list_container)
+        layout.addWidget(self.scroll)
+
+        btn_layout = QHBoxLayout()
+        self.lbl_empty = QLabel("No downloads queued.")
+        self.lbl_empty.setFont(font)
+        self.lbl_empty.setStyleSheet("color: #888;")
+        btn_clear = QPushButton("Clear Finished")
+        btn_clear.setFont(font)
+        btn_clear.setProperty("class", "actionBtn")
+        btn_clear.clicked.connect(manager.clear_finished)
+        btn_layout.addWidget(self.lbl_empty)
+        btn_layout.addStretch()
+        btn_layout.addWidget(btn_clear)
+        layout.addLayout(btn_layout)
+
+        manager.queue_changed.connect(self.rebuild)
+        manager.job_progress.connect(self.update_job)
+        self.rebuild()
+
+    def rebuild(self):
+        while self.list_vbox.count():
+            w = self.list_vbox.takeAt(0).widget()
+            if w: w.deleteLater()
+        self.rows = {}
+        for job in self.manager.jobs:
+            row = QueueRowWidget(job, self.manager, self.row_font)
+            self.rows[job['id']] = row
+            self.list_vbox.addWidget(row)
+        self.lbl_empty.setVisible(not self.manager.jobs)
+
+    def update_job(self, job_id, percent, text):
+        if (row := self.rows.get(job_id)): row.set_progress(percent, text)
+
 class SettingsPage(QWidget):
+    saved = pyqtSignal()
+
     def __init__(self, font):
         super().__init__()
         layout = QVBoxLayout(self)
@@ -280,7 +804,7 @@ class SettingsPage(QWidget):
         
         lbl_path = QLabel("Default Path:")
         lbl_path.setFont(font)
-        self.path_edit = QLineEdit(DEFAULT_DOWNLOAD_PATH)
+        self.path_edit = QLineEdit(core.DEFAULT_DOWNLOAD_PATH)
         self.path_edit.setFont(font)
         self.path_edit.setPlaceholderText("Click Save to update default...")
         form.addRow(lbl_path, self.path_edit)
@@ -294,9 +818,9 @@ class SettingsPage(QWidget):
         speed_layout.setSpacing(10)
 
         self.tog_speed = PyToggle()
-        self.tog_speed.setChecked(SHOW_SPEED_IN_MBPS)
+        self.tog_speed.setChecked(core.SHOW_SPEED_IN_MBPS)
         
-        self.lbl_speed_unit = QLabel("Mbps" if SHOW_SPEED_IN_MBPS else "MB/s")
+        self.lbl_speed_unit = QLabel("Mbps" if core.SHOW_SPEED_IN_MBPS else "MB/s")
         self.lbl_speed_unit.setFont(font)
         self.lbl_speed_unit.setStyleSheet("color: #aaa;") 
         self.tog_speed.stateChanged.connect(self.update_speed_label)
@@ -315,8 +839,8 @@ class SettingsPage(QWidget):
         notif_layout.setSpacing(10)
 
         self.tog_notif = PyToggle()
-        self.tog_notif.setChecked(ENABLE_NOTIFICATIONS)
-        self.lbl_notif_state = QLabel("On" if ENABLE_NOTIFICATIONS else "Off")
+        self.tog_notif.setChecked(core.ENABLE_NOTIFICATIONS)
+        self.lbl_notif_state = QLabel("On" if core.ENABLE_NOTIFICATIONS else "Off")
         self.lbl_notif_state.setFont(font)
         self.lbl_notif_state.setStyleSheet("color: #aaa;")
 
@@ -326,6 +850,58 @@ class SettingsPage(QWidget):
         notif_layout.addWidget(self.lbl_notif_state)
         notif_layout.addStretch()
         form.addRow(lbl_notif, notif_container)
+
+        lbl_limit = QLabel("Speed Limit:")
+        lbl_limit.setFont(font)
+        self.limit_edit = self._limit_edit(core.SPEED_LIMIT, "Unlimited (MB/s, all downloads)", font)
+        form.addRow(lbl_limit, self.limit_edit)
+
+        lbl_job_limit = QLabel("Per Download:")
+        lbl_job_limit.setFont(font)
+        self.job_limit_edit = self._limit_edit(core.JOB_SPEED_LIMIT, "Unlimited (MB/s, each download)", font)
+        form.addRow(lbl_job_limit, self.job_limit_edit)
+
+        lbl_adaptive = QLabel("Adaptive Conns:")
+        lbl_adaptive.setFont(font)
+
+        adaptive_container = QWidget()
+        adaptive_layout = QHBoxLayout(adaptive_container)
+        adaptive_layout.setContentsMargins(0, 0, 0, 0)
+        adaptive_layout.setSpacing(10)
+
+        self.tog_adaptive = PyToggle()
+        self.tog_adaptive.setChecked(core.ADAPTIVE_CONNECTIONS)
+        self.lbl_adaptive_state = QLabel("On" if core.ADAPTIVE_CONNECTIONS else "Off")
+        self.lbl_adaptive_state.setFont(font)
+        self.lbl_adaptive_state.setStyleSheet("color: #aaa;")
+        self.tog_adaptive.stateChanged.connect(lambda state: self.lbl_adaptive_state.setText("On" if state else "Off"))
+
+        adaptive_layout.addWidget(self.tog_adaptive)
+        adaptive_layout.addWidget(self.lbl_adaptive_state)
+        adaptive_layout.addStretch()
+        form.addRow(lbl_adaptive, adaptive_container)
+
+        lbl_keys_dir = QLabel("Install Keys:")
+        lbl_keys_dir.setFont(font)
+        self.keys_dir_edit = QLineEdit(core.KEYS_INSTALL_PATH)
+        self.keys_dir_edit.setFont(font)
+        self.keys_dir_edit.setPlaceholderText("Off (emulator keys folder, unzipped while downloading)")
+        form.addRow(lbl_keys_dir, self.keys_dir_edit)
+
+        lbl_fw_dir = QLabel("Install Firmware:")
+        lbl_fw_dir.setFont(font)
+        self.fw_dir_edit = QLineEdit(core.FW_INSTALL_PATH)
+        self.fw_dir_edit.setFont(font)
+        self.fw_dir_edit.setPlaceholderText("Off (emulator firmware folder, unzipped while downloading)")
+        form.addRow(lbl_fw_dir, self.fw_dir_edit)
+
+        lbl_watch = QLabel("Watch Releases:")
+        lbl_watch.setFont(font)
+        self.tog_watch = self._state_toggle(core.WATCH_ENABLED, font, form, lbl_watch)
+
+        lbl_prefetch = QLabel("Prefetch New:")
+        lbl_prefetch.setFont(font)
+        self.tog_prefetch = self._state_toggle(core.WATCH_PREFETCH, font, form, lbl_prefetch)
         
         layout.addLayout(form)
         layout.addStretch()
@@ -370,6 +946,31 @@ class SettingsPage(QWidget):
         btn_layout.addWidget(btn_save)
         layout.addLayout(btn_layout)
 
+    def _state_toggle(self, value, font, form, label):
+        """A PyToggle with an On/Off label, added to `form` as one row"""
+        container = QWidget()
+        row = QHBoxLayout(container)
+        row.setContentsMargins(0, 0, 0, 0)
+        row.setSpacing(10)
+        toggle = PyToggle()
+        toggle.setChecked(value)
+        state = QLabel("On" if value else "Off")
+        state.setFont(font)
+        state.setStyleSheet("color: #aaa;")
+        toggle.stateChanged.connect(lambda checked: state.setText("On" if checked else "Off"))
+        row.addWidget(toggle)
+        row.addWidget(state)
+        row.addStretch()
+        form.addRow(label, container)
+        return toggle
+
+    def _limit_edit(self, value, placeholder, font):
+        edit = QLineEdit(f"{value:g}" if value > 0 else "")
+        edit.setFont(font)
+        edit.setPlaceholderText(placeholder)
+        edit.setValidator(QDoubleValidator(0.0, 100000.0, 2, edit))
+        return edit
+
     def update_speed_label(self, state):
         self.lbl_speed_unit.setText("Mbps" if state else "MB/s")
 
@@ -377,11 +978,18 @@ class SettingsPage(QWidget):
         self.lbl_notif_state.setText("On" if state else "Off")
 
     def save(self):
-        global DEFAULT_DOWNLOAD_PATH, SHOW_SPEED_IN_MBPS, ENABLE_NOTIFICATIONS
-        DEFAULT_DOWNLOAD_PATH = self.path_edit.text()
-        SHOW_SPEED_IN_MBPS = self.tog_speed.isChecked()
-        ENABLE_NOTIFICATIONS = self.tog_notif.isChecked()
+        core.DEFAULT_DOWNLOAD_PATH = self.path_edit.text()
+        core.SHOW_SPEED_IN_MBPS = self.tog_speed.isChecked()
+        core.ENABLE_NOTIFICATIONS = self.tog_notif.isChecked()
+        core.SPEED_LIMIT = self._limit_value(self.limit_edit)
+        core.JOB_SPEED_LIMIT = self._limit_value(self.job_limit_edit)
+        core.ADAPTIVE_CONNECTIONS = self.tog_adaptive.isChecked()
+        core.KEYS_INSTALL_PATH = self.keys_dir_edit.text().strip()
+        core.FW_INSTALL_PATH = self.fw_dir_edit.text().strip()
+        core.WATCH_ENABLED = self.tog_watch.isChecked()
+        core.WATCH_PREFETCH = self.tog_prefetch.isChecked()
         save_settings_to_file()
+        self.saved.emit()
         
         sender = self.sender()
         original_text = "Save Settings"
@@ -391,10 +999,72 @@ class SettingsPage(QWidget):
         QTimer.singleShot(1500, lambda: self._reset_btn(sender, original_text))
         print("Settings Saved")
 
+    @staticmethod
+    def _limit_value(edit):
+        """MB/s from a limit field; empty or 0 means unlimited"""
+        try: return max(0.0, float(edit.text().replace(',', '.')))
+        except ValueError: return 0.0
+
     def _reset_btn(self, btn, text):
         btn.setText(text)
         btn.setStyleSheet(self.btn_style_normal)
 
+class MetricsPage(QWidget):
+    """Live view of core.METRICS: scrape phases per index page, throughput, retries, stalls and disk time per
+    download, and the HTTP counters. Only refreshes while it is shown."""
+    def __init__(self, font):
+        super().__init__()
+        layout = QVBoxLayout(self)
+        self.labels = {}
+        for key, title in (('pages', "Catalog Pages"), ('downloads', "Downloads"), ('http', "HTTP")):
+            header = QLabel(title)
+            header.setFont(font)
+            header.setStyleSheet("font-size: 13px; font-weight: bold; color: #00ff7f;")
+            body = QLabel()
+            body.setFont(font)
+            body.setStyleSheet("color: #aaa;")
+            body.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+            layout.addWidget(header)
+            layout.addWidget(body)
+            self.labels[key] = body
+        layout.addStretch()
+        lbl_log = QLabel(f"Log: {core.METRICS_LOG}")
+        lbl_log.setFont(font)
+        lbl_log.setStyleSheet("color: #666;")
+        lbl_log.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        layout.addWidget(lbl_log)
+        self.timer = QTimer(self)
+        self.timer.setInterval(1000)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        snap = core.METRICS.snapshot()
+        self.labels['pages'].setText("\n".join(
+            f"{name}: {p['host']} | Connect {p['connect_ms']:.0f} ms | TLS {p['tls_ms']:.0f} ms | TTFB {p['ttfb_ms']:.0f} ms | "
+            f"Body {p['body_ms']:.0f} ms | Parse {p['parse_ms']:.0f} ms | {p['state']}"
+            for name, p in snap['pages'].items()) or "Not fetched yet.")
+        self.labels['downloads'].setText("\n".join(self._download_line(d) for d in snap['downloads']) or "No downloads yet.")
+        h = snap['http']
+        self.labels['http'].setText(
+            f"{h['requests']} requests | {h['connections_opened']} connections ({h['connections_reused']} reused) | "
+            f"{h['retries']} retries, {h['failures']} failed | {h['backoff_seconds']:.1f}s backoff | {h['bytes'] / 1e6:.1f} MB read")
+
+    @staticmethod
+    def _download_line(d):
+        done = f"{d['received'] / 1e6:.1f} MB"
+        now = d['result'] if 'result' in d else f"{format_speed(d['speed'])} now"
+        return (f"{d['name']} ({d['host']}) | {now} | {format_speed(d['average'])} avg | {done} | "
+                f"{d['retries']} retries, {d['stalls']} stalls | disk {d['write_s']:.2f}s")
+
 # --- MAIN WINDOW ---
 class MainWindow(QWidget):
     def __init__(self):
@@ -405,38 +1075,66 @@ class MainWindow(QWidget):
         
         self.data_list = []
         self.scraper = ProdKeysScraper()
+        self.catalog_worker, self.catalog_workers = None, set()
+        self.watch_worker, self.tray, self.quitting = None, None, False
+        self.downloads = DownloadManager()
+        self.downloads.queue_changed.connect(self.yield_prefetch)
         
         self.asset_cache = os.path.join(DATA_FOLDER, 'cache')
         os.makedirs(self.asset_cache, exist_ok=True)
         self.load_assets()
         
-        if os.path.exists(ICON_PATH):
-            self.setWindowIcon(QIcon(ICON_PATH))
+        if icon := asset_path('icon'):
+            self.setWindowIcon(QIcon(icon))
+        STARTUP_PROFILE.mark('assets')
             
         load_settings()
+        STARTUP_PROFILE.mark('settings')
         self.initUI()
-        QTimer.singleShot(100, self.refresh_data)
+        STARTUP_PROFILE.mark('init_ui')
+        self.show_versions(self.scraper.load_cached())
+        if self.data_list:
+            self.status_label.setText(f"Found {len(self.data_list)} versions (cached).")
+        if not is_catalog_fresh(self.scraper.cache):
+            QTimer.singleShot(100, self.refresh_data)
+        QTimer.singleShot(0, self.start_asset_fetch)
+        QTimer.singleShot(0, self.apply_watch_settings)
 
     def load_assets(self):
-        def download_if_missing(url, path, name):
-            if not os.path.exists(path):
-                try:
-                    print(f"Downloading {name}...")
-                    r = requests.get(url, timeout=10)
-                    with open(path, 'wb') as f: f.write(r.content)
-                except Exception as e: print(f"Failed {name}: {e}")
-
-        download_if_missing(ICON_URL, ICON_PATH, "App Icon")
-        download_if_missing(SETTINGS_ICON_URL, SETTINGS_ICON_PATH, "Settings Icon")
-        download_if_missing(RELOAD_ICON_URL, RELOAD_ICON_PATH, "Reload Icon")
-        download_if_missing(FONT_URL, FONT_PATH, "Font")
-        
+        """Uses the bundled pack or cached overrides; anything missing from both is fetched later by start_asset_fetch"""
+        load_asset_pack()
         self.main_font = QFont("Segoe UI", 10)
-        if os.path.exists(FONT_PATH):
-            fid = QFontDatabase.addApplicationFont(FONT_PATH)
-            if fid != -1:
-                fam = QFontDatabase.applicationFontFamilies(fid)[0]
-                self.main_font = QFont(fam, 12)
+        if font := asset_path('font'): self.main_font = self._load_font(font) or self.main_font
+
+    def _load_font(self, path):
+        fid = QFontDatabase.addApplicationFont(path)
+        if fid == -1: return None
+        return QFont(QFontDatabase.applicationFontFamilies(fid)[0], 12)
+
+    def start_asset_fetch(self):
+        missing = {name: src for name, src in asset_sources().items() if not asset_path(name)}
+        if not missing: return
+        self.asset_thread = AssetFetcher(missing)
+        self.asset_thread.asset_ready.connect(self.apply_asset)
+        self.asset_thread.start()
+
+    def apply_asset(self, name, path):
+        """Hot-swaps an asset that arrived after the window was shown"""
+        if name == 'icon': self.setWindowIcon(QIcon(path))
+        elif name == 'settings_icon': self._set_circle_icon(self.btn_settings, path)
+        elif name == 'reload_icon': self._set_circle_icon(self.btn_reload, path)
+        elif name == 'font' and (font := self._load_font(path)):
+            old_family = self.main_font.family()
+            self.main_font = font
+            for widget in self.findChildren(QWidget):
+                if widget.font().family() == old_family: widget.setFont(font)
+            self.version_view.set_font(font)
+            self.page_downloads.row_font = font
+
+    def _set_circle_icon(self, btn, path):
+        btn.setText("")
+        btn.setIcon(QIcon(path))
+        btn.setIconSize(QSize(25, 25))
 
     def initUI(self):
         main_layout = QVBoxLayout(self)
@@ -456,8 +1154,14 @@ class MainWindow(QWidget):
         self.pbar.setFixedWidth(550)
         self.pbar.setVisible(False)
         
+        self.task_rows = {}
+        self.task_area = QWidget()
+        self.task_vbox = QVBoxLayout(self.task_area)
+        self.task_vbox.setContentsMargins(0, 0, 0, 0); self.task_vbox.setSpacing(1)
+
         status_layout.addWidget(self.status_label)
         status_layout.addWidget(self.pbar)
+        status_layout.addWidget(self.task_area)
         
         self.btn_back_top = QPushButton("<< Back to Library")
         self.btn_back_top.setObjectName("TopBackBtn")
@@ -474,28 +1178,46 @@ class MainWindow(QWidget):
         self.search_inp.setPlaceholderText("Search Version...")
         self.search_inp.setFixedWidth(210)
         self.search_inp.setFont(self.main_font)
-        self.search_inp.textChanged.connect(self.filter_list)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_search)
+        self.search_inp.textChanged.connect(self.search_timer.start)
         top_bar.addWidget(self.search_inp)
 
-        btn_reload = QPushButton()
+        self.btn_reload = btn_reload = QPushButton()
         btn_reload.setObjectName("CircleBtn")
         btn_reload.setFixedSize(35, 35)
         btn_reload.setToolTip("Reload List")
-        if os.path.exists(RELOAD_ICON_PATH):
-            btn_reload.setIcon(QIcon(RELOAD_ICON_PATH))
+        if reload_icon := asset_path('reload_icon'):
+            btn_reload.setIcon(QIcon(reload_icon))
             btn_reload.setIconSize(QSize(25, 25))
         else: btn_reload.setText("↻")
         btn_reload.clicked.connect(self.refresh_data)
         top_bar.addWidget(btn_reload)
 
-        btn_settings = QPushButton()
+        self.btn_settings = btn_settings = QPushButton()
         btn_settings.setObjectName("CircleBtn")
         btn_settings.setFixedSize(35, 35)
-        if os.path.exists(SETTINGS_ICON_PATH):
-            btn_settings.setIcon(QIcon(SETTINGS_ICON_PATH))
+        if settings_icon := asset_path('settings_icon'):
+            btn_settings.setIcon(QIcon(settings_icon))
             btn_settings.setIconSize(QSize(25, 25))
         else: btn_settings.setText("⚙")
         btn_settings.clicked.connect(self.go_settings)
+
+        btn_queue = QPushButton("⇩")
+        btn_queue.setObjectName("CircleBtn")
+        btn_queue.setFixedSize(35, 35)
+        btn_queue.setToolTip("Downloads")
+        btn_queue.clicked.connect(self.go_downloads)
+
+        btn_metrics = QPushButton("≋")
+        btn_metrics.setObjectName("CircleBtn")
+        btn_metrics.setFixedSize(35, 35)
+        btn_metrics.setToolTip("Metrics")
+        btn_metrics.clicked.connect(self.go_metrics)
+        top_bar.addWidget(btn_queue)
+        top_bar.addWidget(btn_metrics)
         top_bar.addWidget(btn_settings)
         
         main_layout.addLayout(top_bar)
@@ -525,96 +1247,246 @@ class MainWindow(QWidget):
         
         list_layout.addWidget(header_widget)
 
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.list_container = QWidget()
-        self.list_vbox = QVBoxLayout(self.list_container)
-        self.list_vbox.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.scroll.setWidget(self.list_container)
-        list_layout.addWidget(self.scroll)
+        self.version_model = VersionListModel()
+        self.version_index = VersionSearchIndex([])
+        self.version_proxy = VersionFilterProxy()
+        self.version_proxy.setSourceModel(self.version_model)
+        self.version_view = VersionListView(self.main_font)
+        self.version_view.setModel(self.version_proxy)
+        self.version_view.download_requested.connect(self.handle_download)
+        list_layout.addWidget(self.version_view)
         self.stack.addWidget(self.page_list)
         
         self.page_settings = SettingsPage(self.main_font)
+        self.page_settings.saved.connect(self.apply_watch_settings)
         self.stack.addWidget(self.page_settings)
 
+        self.page_downloads = DownloadsPage(self.downloads, self.main_font)
+        self.stack.addWidget(self.page_downloads)
+
+        self.page_metrics = MetricsPage(self.main_font)
+        self.stack.addWidget(self.page_metrics)
+
         main_layout.addWidget(self.stack)
 
+        self.downloads.progress.connect(self.update_progress)
+        self.downloads.job_progress.connect(self.update_task_progress)
+        self.downloads.queue_changed.connect(self.sync_task_rows)
+        self.downloads.all_finished.connect(self.download_finished)
+        if self.downloads.jobs: self.status_label.setText(f"{len(self.downloads.jobs)} paused download(s) in the queue.")
+
     def go_settings(self):
         self.status_container.hide()
         self.btn_back_top.show()
         self.stack.setCurrentIndex(1)
 
+    def go_downloads(self):
+        self.status_container.hide()
+        self.btn_back_top.show()
+        self.stack.setCurrentIndex(2)
+
+    def go_metrics(self):
+        self.status_container.hide()
+        self.btn_back_top.show()
+        self.stack.setCurrentIndex(3)
+
     def go_home(self):
         self.btn_back_top.hide()
         self.status_container.show()
         self.stack.setCurrentIndex(0)
 
     def refresh_data(self):
-        self.status_label.setText("Loading...")
-        while self.list_vbox.count():
-            item = self.list_vbox.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
-        
-        self.loader_thread = QThread()
-        self.scraper.moveToThread(self.loader_thread)
-        self.loader_thread.started.connect(lambda: self.run_scraper())
-        self.loader_thread.start()
+        """Starts a catalog reload; one still in flight is cancelled and anything it still reports is dropped"""
+        if self.catalog_worker: self.catalog_worker.cancel()
+        self.status_label.setText("Checking for updates..." if self.data_list else "Loading...")
+        worker = self.catalog_worker = CatalogWorker()
+        worker.rows_ready.connect(self.catalog_rows)
+        worker.loaded.connect(self.catalog_loaded)
+        worker.finished.connect(self.catalog_worker_done)
+        self.catalog_workers.add(worker)
+        worker.start()
 
-    def run_scraper(self):
-        data = self.scraper.fetch_data()
-        self.data_list = data
-        self.filter_list("")
+    def catalog_rows(self, data):
+        if self.sender() is not self.catalog_worker: return
+        if data != self.data_list: self.show_versions(data)
+        self.status_label.setText(f"Loading... {len(data)} versions so far.")
+
+    def catalog_loaded(self, data):
+        if self.sender() is not self.catalog_worker: return
+        self.scraper = self.catalog_worker.scraper
+        self.catalog_worker = None
+        if data != self.data_list: self.show_versions(data)
         self.status_label.setText(f"Found {len(data)} versions.")
-        self.loader_thread.quit()
+
+    def catalog_worker_done(self):
+        # Cancelled workers are kept referenced until their thread really ends
+        worker = self.sender()
+        self.catalog_workers.discard(worker)
+        if worker is self.catalog_worker:
+            self.catalog_worker = None
+            self.status_label.setText(f"Found {len(self.data_list)} versions.")
+        worker.deleteLater()
+
+    # --- WATCH MODE ---
+    def apply_watch_settings(self):
+        """Starts or stops the watcher and its tray icon to match core.WATCH_ENABLED"""
+        if core.WATCH_ENABLED and not self.watch_worker:
+            self.watch_worker = WatchWorker(self.downloads.busy)
+            self.watch_worker.changed.connect(self.watch_changed)
+            self.watch_worker.status.connect(print)
+            self.watch_worker.start()
+            if QSystemTrayIcon.isSystemTrayAvailable(): self._show_tray()
+        elif not core.WATCH_ENABLED and self.watch_worker:
+            self.watch_worker.stop()
+            self.watch_worker.finished.connect(self.watch_worker.deleteLater)
+            self.watch_worker = None
+            if self.tray: self.tray.hide()
+        QApplication.instance().setQuitOnLastWindowClosed(not (self.tray and self.tray.isVisible()))
+
+    def yield_prefetch(self):
+        """A background prefetch gives way as soon as the download queue has work"""
+        if self.watch_worker and self.downloads.busy(): self.watch_worker.watcher.stop_prefetch()
+
+    def _show_tray(self):
+        if not self.tray:
+            self.tray = QSystemTrayIcon(self.windowIcon(), self)
+            self.tray.setToolTip("Watching for new keys & firmware")
+            menu = QMenu(self)
+            menu.addAction("Open", self.show_from_tray)
+            menu.addAction("Check Now", lambda: self.watch_worker and self.watch_worker.watcher.check_now())
+            menu.addSeparator()
+            menu.addAction("Quit", self.quit_from_tray)
+            self.tray.setContextMenu(menu)
+            self.tray.activated.connect(lambda reason: reason == QSystemTrayIcon.ActivationReason.Trigger and self.show_from_tray())
+        self.tray.setIcon(self.windowIcon())
+        self.tray.show()
+
+    def show_from_tray(self):
+        self.showNormal(); self.raise_(); self.activateWindow()
+
+    def quit_from_tray(self):
+        self.quitting = True
+        self.close()
+
+    def watch_changed(self, delta):
+        self.refresh_data()
+        message = core.describe_changes(delta)
+        self.status_label.setText(message)
+        if core.ENABLE_NOTIFICATIONS: core.notify(message, icon=notification_icon())
+
+    def show_versions(self, data):
+        self.data_list = data
+        self.version_view.clear_hover()
+        self.version_index = VersionSearchIndex(data)
+        self.version_proxy.visible = None
+        self.version_model.set_items(data)
+        self.filter_list(self.search_inp.text())
+
+    def apply_search(self):
+        self.filter_list(self.search_inp.text())
 
     def filter_list(self, text):
-        while self.list_vbox.count():
-            w = self.list_vbox.takeAt(0).widget()
-            if w: w.setParent(None)
-        
-        text = text.lower()
-        for item in self.data_list:
-            if text in item['version'].lower():
-                row = VersionRowWidget(item, self.main_font)
-                row.download_requested.connect(self.handle_download)
-                self.list_vbox.addWidget(row)
+        self.version_view.clear_hover()
+        return self.version_proxy.set_rows(self.version_index.query(text))
 
     def handle_download(self, mode, data):
-        directory = QFileDialog.getExistingDirectory(self, "Select Download Folder", DEFAULT_DOWNLOAD_PATH)
+        directory = QFileDialog.getExistingDirectory(self, "Select Download Folder", core.DEFAULT_DOWNLOAD_PATH)
         if not directory: return
         
         tasks = []
         if mode in ['keys', 'both'] and (url := data.get('keys_url')):
-            tasks.append((url, os.path.join(directory, f"ProdKeys_{data['version']}.zip")))
-        if mode in ['fw', 'both'] and (url := data.get('fw_url')):
-            tasks.append((url, os.path.join(directory, f"Firmware_{data['version']}.zip")))
+            tasks.append((url, os.path.join(directory, f"ProdKeys_{data['version']}.zip"), 1, core.KEYS_INSTALL_PATH))
+        if mode in ['fw', 'both'] and (url := data.get('fw_mirrors') or data.get('fw_url')):
+            tasks.append((url, os.path.join(directory, f"Firmware_{data['version']}.zip"), 0, core.FW_INSTALL_PATH))
         if not tasks:
             QMessageBox.warning(self, "Error", "No valid links found.")
             return
 
-        self.pbar.setVisible(True); self.pbar.setValue(0)
-        self.status_label.setText("Starting download...")
-        
-        self.dl_thread = DownloadWorker(tasks)
-        self.dl_thread.progress.connect(self.update_progress)
-        self.dl_thread.finished.connect(self.download_finished)
-        self.dl_thread.start()
+        queued = [self.downloads.enqueue(*task) for task in tasks]
+        if not any(queued):
+            self.status_label.setText("Already in the download queue.")
+            return
+        self.pbar.setVisible(True)
+        self.status_label.setText(f"Queued {sum(queued)} file(s)...")
 
     def update_progress(self, val, text):
-        self.pbar.setValue(val); self.status_label.setText(text)
+        self.pbar.setVisible(True); self.pbar.setValue(val); self.status_label.setText(text)
+
+    def update_task_progress(self, job_id, val, text):
+        if (row := self.task_rows.get(job_id)): row.set_progress(val, text)
+
+    def sync_task_rows(self):
+        """Keeps one slim status row per running job while more than one is running"""
+        running = [job for job in self.downloads.jobs if job['state'] == 'running']
+        if self.pbar.isVisible() and not any(job['state'] in ('queued', 'running') for job in self.downloads.jobs):
+            self.pbar.setVisible(False); self.status_label.setText("Downloads paused.")
+        wanted = {job['id'] for job in running} if len(running) > 1 else set()
+        for job_id in list(self.task_rows):
+            if job_id not in wanted: self.task_rows.pop(job_id).deleteLater()
+        for job in running:
+            if job['id'] in wanted and job['id'] not in self.task_rows:
+                row = TaskProgressRow(self.main_font)
+                row.set_progress(job['percent'], job['text'])
+                self.task_vbox.addWidget(row)
+                self.task_rows[job['id']] = row
+
+    def clear_task_rows(self):
+        for row in self.task_rows.values(): row.deleteLater()
+        self.task_rows = {}
 
     def download_finished(self, success, msg):
         self.pbar.setVisible(False); self.status_label.setText(msg)
-        if success and ENABLE_NOTIFICATIONS:
-            try: notification.notify(title="Zuhu's Keys & Firmware Downloader", message="Download Complete", app_icon=ICON_PATH, timeout=5)
-            except: pass
+        self.clear_task_rows()
+        if success and core.ENABLE_NOTIFICATIONS: core.notify("Download Complete", icon=notification_icon())
         elif not success: QMessageBox.critical(self, "Error", msg)
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        STARTUP_PROFILE.mark('first_paint')
+
+    def closeEvent(self, event):
+        if self.tray and self.tray.isVisible() and not self.quitting:
+            # Watch mode keeps running in the tray; Quit in its menu really exits
+            event.ignore()
+            self.hide()
+            self.tray.showMessage("Still watching", "New releases will be reported from here.", QSystemTrayIcon.MessageIcon.Information, 3000)
+            return
+        if self.watch_worker:
+            self.watch_worker.stop()
+            self.watch_worker.wait(3000)
+        if self.tray: self.tray.hide()
+        for worker in self.catalog_workers: worker.cancel()
+        for worker in self.catalog_workers: worker.wait(3000)
+        self.downloads.shutdown()
+        super().closeEvent(event)
+        QApplication.instance().quit()
+
+def profile_startup(app, out_path):
+    """--profile-startup[=FILE]: quit once every phase has been seen (or after PROFILE_TIMEOUT_MS) and emit the report"""
+    deadline = time.perf_counter() + PROFILE_TIMEOUT_MS / 1000
+    def check():
+        if not STARTUP_PROFILE.complete() and time.perf_counter() < deadline: return
+        report = json.dumps(STARTUP_PROFILE.report())
+        if out_path:
+            with open(out_path, 'w') as f: f.write(report + '\n')
+        else: print(report, flush=True)
+        app.quit()
+    timer = QTimer(app)
+    timer.timeout.connect(check)
+    timer.start(20)
+
 if __name__ == '__main__':
+    STARTUP_PROFILE.mark('import')
+    profile_arg = next((arg for arg in sys.argv if arg.split('=')[0] == '--profile-startup'), None)
+    if profile_arg: sys.argv.remove(profile_arg)
     myappid = 'NNTND-SWTCH-DWNLDR'
-    try: ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
+    try:
+        import ctypes
+        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
     except: pass
     app = QApplication(sys.argv)
+    STARTUP_PROFILE.mark('qt_app')
     win = MainWindow()
     win.show()
+    if profile_arg: profile_startup(app, profile_arg.partition('=')[2])
     sys.exit(app.exec())
\ No newline at end of file
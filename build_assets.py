@@ -0,0 +1,71 @@
+"""
+Packs everything in Assets/ into Assets.rcc, a binary Qt resource file.
+
+Switch-Downloader.py registers the pack with QResource at startup (Qt maps the file, so every icon
+and the font come out of a single open) and only falls back to downloading assets that are missing
+from both the pack and the user's cache folder.
+
+Usage: py build_assets.py [--src Assets] [--out Assets.rcc]
+Ship Assets.rcc next to Switch-Downloader.py (or add it as PyInstaller data for the .exe).
+"""
+import argparse
+import os
+import struct
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PREFIX = "assets"
+DIRECTORY = 0x02
+ANY_TERRITORY, C_LANGUAGE = 0, 1
+
+def qt_hash(name):
+    """The hash Qt keys resource names by; siblings must be stored sorted by it"""
+    h = 0
+    for ch in name:
+        h = (h << 4) + ord(ch)
+        h ^= (h & 0xf0000000) >> 23
+        h &= 0x0fffffff
+    return h
+
+def build_pack(files):
+    """files: {name: bytes} -> rcc v1 image containing /<PREFIX>/<name> for every entry"""
+    names, name_offsets = bytearray(), {}
+    def add_name(name):
+        if name not in name_offsets:
+            name_offsets[name] = len(names)
+            encoded = name.encode('utf-16-be')
+            names.extend(struct.pack('>HI', len(encoded) // 2, qt_hash(name)) + encoded)
+        return name_offsets[name]
+
+    data, tree = bytearray(), bytearray()
+    # Node 0 is the root, node 1 the prefix directory, nodes 2.. its files in hash order
+    tree += struct.pack('>IHII', 0, DIRECTORY, 1, 1)
+    tree += struct.pack('>IHII', add_name(PREFIX), DIRECTORY, len(files), 2)
+    for name in sorted(files, key=qt_hash):
+        tree += struct.pack('>IHHHI', add_name(name), 0, ANY_TERRITORY, C_LANGUAGE, len(data))
+        data += struct.pack('>I', len(files[name])) + files[name]
+
+    header_size = 20
+    tree_offset = header_size
+    data_offset = tree_offset + len(tree)
+    names_offset = data_offset + len(data)
+    return b'qres' + struct.pack('>IIII', 1, tree_offset, data_offset, names_offset) + tree + data + names
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile Assets/ into a Qt resource pack")
+    parser.add_argument('--src', default=os.path.join(ROOT, 'Assets'))
+    parser.add_argument('--out', default=os.path.join(ROOT, 'Assets.rcc'))
+    args = parser.parse_args()
+
+    files = {}
+    for name in sorted(os.listdir(args.src)):
+        path = os.path.join(args.src, name)
+        if os.path.isfile(path):
+            with open(path, 'rb') as f: files[name] = f.read()
+    pack = build_pack(files)
+    tmp_path = args.out + '.tmp'
+    with open(tmp_path, 'wb') as f: f.write(pack)
+    os.replace(tmp_path, args.out)
+    print(f"Packed {len(files)} assets into {args.out} ({len(pack) / 1024:.0f} KiB)")
+
+if __name__ == "__main__":
+    main()
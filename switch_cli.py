@@ -0,0 +1,150 @@
+"""
+Zuhu's Keys & Firmware Downloader - headless mode
+
+Uses the same scraper, catalog cache, download engine and settings as the GUI, without PyQt6.
+
+Usage:
+    py switch_cli.py --list [--refresh] [--json]
+    py switch_cli.py --get latest --what both --out DIR
+    py switch_cli.py --get v19.0.1 --what keys
+    py switch_cli.py --get latest --keys-dir EMU/system --fw-dir EMU/firmware
+    py switch_cli.py --watch [--interval 30] [--prefetch]
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+import switch_core as core
+from switch_core import ProdKeysScraper, Downloader, CatalogWatcher, load_settings, is_catalog_fresh
+
+def load_catalog(refresh=False, verbose=False):
+    """The cached catalog while it is fresh, otherwise a (conditional) fetch of both index pages"""
+    scraper = ProdKeysScraper()
+    if verbose: scraper.status_update.connect(lambda text: print(text, file=sys.stderr))
+    catalog = scraper.load_cached()
+    if refresh or not is_catalog_fresh(scraper.cache): catalog = scraper.fetch_data()
+    return catalog
+
+def find_entry(catalog, version, what):
+    """`latest` is the newest entry that has every requested file; otherwise an exact version match"""
+    wanted = [key for key, mode in (('keys_url', 'keys'), ('fw_url', 'fw')) if what in (mode, 'both')]
+    if version.lower() == 'latest':
+        return next((item for item in catalog if all(item.get(key) for key in wanted)), None)
+    version = version.lower().lstrip('v')
+    return next((item for item in catalog if item['version'].lower().lstrip('v') == version), None)
+
+def build_tasks(entry, what, directory, keys_dir="", fw_dir=""):
+    """(url, save_path, install_dir) with the same file names as the GUI's download buttons; the firmware
+    url is the list of all its mirrors"""
+    tasks = []
+    if what in ('keys', 'both') and (url := entry.get('keys_url')):
+        tasks.append((url, os.path.join(directory, f"ProdKeys_{entry['version']}.zip"), keys_dir))
+    if what in ('fw', 'both') and (url := entry.get('fw_mirrors') or entry.get('fw_url')):
+        tasks.append((url, os.path.join(directory, f"Firmware_{entry['version']}.zip"), fw_dir))
+    return tasks
+
+def run_downloads(tasks, quiet=False):
+    """Runs the engine on a worker thread so Ctrl+C can stop it cleanly (partial files stay resumable)"""
+    engine = Downloader([(url, save_path) for url, save_path, _ in tasks], [install_dir for *_, install_dir in tasks])
+    result = {'success': False, 'msg': "Stopped"}
+    if not quiet:
+        engine.progress.connect(lambda percent, text: print(f"\r{text:<70}", end='', file=sys.stderr, flush=True))
+    engine.finished.connect(lambda success, msg: result.update(success=success, msg=msg))
+    thread = threading.Thread(target=engine.run, daemon=True)
+    thread.start()
+    try:
+        while thread.is_alive(): thread.join(0.2)
+    except KeyboardInterrupt:
+        engine.is_running = False
+        thread.join()
+    if not quiet: print(file=sys.stderr)
+    return result['success'], result['msg']
+
+def watch(quiet=False):
+    """Headless watch mode: prints (and notifies about) each change until Ctrl+C"""
+    watcher = CatalogWatcher()
+    def changed(delta):
+        message = core.describe_changes(delta)
+        print(f"{time.strftime('%Y-%m-%d %H:%M')} {message}", flush=True)
+        if core.ENABLE_NOTIFICATIONS: core.notify(message)
+    watcher.changed.connect(changed)
+    if not quiet: watcher.status.connect(lambda text: print(text, file=sys.stderr))
+    thread = threading.Thread(target=watcher.run, daemon=True)
+    thread.start()
+    try:
+        while thread.is_alive(): thread.join(0.5)
+    except KeyboardInterrupt:
+        watcher.stop()
+        thread.join()
+    return 0
+
+def print_catalog(catalog, as_json):
+    if as_json:
+        print(json.dumps(catalog, indent=2))
+        return
+    for item in catalog:
+        files = ", ".join(name for key, name in (('keys_url', "keys"), ('fw_url', "firmware")) if item.get(key))
+        print(f"{item['version']:<12}{files}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Switch keys & firmware downloader")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument('--list', action='store_true', help="print the available versions")
+    action.add_argument('--get', metavar='VERSION', help="download a version ('latest' or e.g. v19.0.1)")
+    action.add_argument('--watch', action='store_true', help="keep running and report new releases")
+    parser.add_argument('--what', choices=('keys', 'fw', 'both'), default='both')
+    parser.add_argument('--out', metavar='DIR', help="target folder (default: the GUI's default path)")
+    parser.add_argument('--keys-dir', metavar='DIR', help="also unzip the keys here while downloading (default: settings)")
+    parser.add_argument('--fw-dir', metavar='DIR', help="also unzip the firmware here while downloading (default: settings)")
+    parser.add_argument('--limit', type=float, metavar='MBPS', help="overall speed limit in MB/s (0 = unlimited)")
+    parser.add_argument('--interval', type=float, metavar='MIN', help="--watch: minutes between checks (default: settings)")
+    parser.add_argument('--prefetch', action='store_true', help="--watch: download new releases in the background")
+    parser.add_argument('--refresh', action='store_true', help="revalidate the catalog even if the cache is fresh")
+    parser.add_argument('--json', action='store_true', help="machine-readable --list output")
+    parser.add_argument('-q', '--quiet', action='store_true', help="no progress output")
+    parser.add_argument('--stats', action='store_true', help="print the HTTP counters as JSON on exit")
+    args = parser.parse_args(argv)
+    try: return run(args)
+    finally:
+        if args.stats: print(json.dumps(core.HTTP_STATS.snapshot()), file=sys.stderr)
+
+def run(args):
+    load_settings()
+    if args.limit is not None: core.SPEED_LIMIT = max(0.0, args.limit)
+    if args.watch:
+        if args.interval is not None: core.WATCH_INTERVAL = max(5.0, args.interval)
+        if args.prefetch: core.WATCH_PREFETCH = True
+        return watch(args.quiet)
+    catalog = load_catalog(args.refresh, verbose=not args.quiet)
+    if not catalog:
+        print("Could not load the version list.", file=sys.stderr)
+        return 1
+    if args.list:
+        print_catalog(catalog, args.json)
+        return 0
+
+    entry = find_entry(catalog, args.get, args.what)
+    if not entry:
+        print(f"No version matching {args.get} with {args.what} files.", file=sys.stderr)
+        return 1
+    directory = args.out or core.DEFAULT_DOWNLOAD_PATH or os.getcwd()
+    os.makedirs(directory, exist_ok=True)
+    keys_dir = core.KEYS_INSTALL_PATH if args.keys_dir is None else args.keys_dir
+    fw_dir = core.FW_INSTALL_PATH if args.fw_dir is None else args.fw_dir
+    tasks = build_tasks(entry, args.what, directory, keys_dir, fw_dir)
+    if not tasks:
+        print(f"{entry['version']} has no {args.what} download.", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    success, msg = run_downloads(tasks, args.quiet)
+    print(f"{entry['version']}: {msg} ({time.perf_counter() - start:.1f}s)", file=sys.stderr)
+    if success:
+        for _, save_path, _ in tasks: print(save_path)
+    return 0 if success else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
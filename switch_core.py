@@ -0,0 +1,1608 @@
+"""
+Zuhu's Keys & Firmware Downloader - core engine
+
+The scraper, catalog cache and download engine with no Qt dependency, shared by the GUI
+(Switch-Downloader.py) and the headless CLI (switch_cli.py).
+"""
+import os
+import json
+import re
+import codecs
+import time
+import threading
+import hashlib
+import random
+import http.client
+import shutil
+import struct
+import zipfile
+import zlib
+from urllib.parse import urlsplit
+from collections import deque
+from itertools import takewhile
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+
+# --- CONFIGURATION ---
+KEYS_URL = "https://prodkeys.net/ryujinx-prod-keys-n25/#more-18"
+FW_URL = "https://prodkeys.net/latest-switch-firmwares-v16/"
+DATA_FOLDER = os.path.join(os.path.expanduser('~'), 'Documents', 'ZuhuProjects', 'ZuhuKeys')
+SETTINGS_FILE = os.path.join(DATA_FOLDER, 'Settings.json')
+CATALOG_CACHE_FILE = os.path.join(DATA_FOLDER, 'cache', 'catalog.json')
+CATALOG_TTL = 6 * 60 * 60
+CATALOG_FORMAT = 2
+MANIFEST_FILE = os.path.join(DATA_FOLDER, 'Manifest.json')
+MIRRORS_FILE = os.path.join(DATA_FOLDER, 'cache', 'mirrors.json')
+WATCH_FILE = os.path.join(DATA_FOLDER, 'cache', 'watch.json')
+METRICS_LOG = os.path.join(DATA_FOLDER, 'Transfers.jsonl')
+METRICS_LOG_MAX = 5 * 1024 * 1024
+METRICS_RECENT = 20
+DEFAULT_DOWNLOAD_PATH = ""
+SHOW_SPEED_IN_MBPS = True
+ENABLE_NOTIFICATIONS = True
+KEYS_INSTALL_PATH = ""
+FW_INSTALL_PATH = ""
+WATCH_ENABLED = False
+WATCH_INTERVAL = 60
+WATCH_PREFETCH = False
+DOWNLOAD_CONNECTIONS = 4
+SEGMENT_SIZE = 8 * 1024 * 1024
+IO_BUFFER_SIZE = 1024 * 1024
+HASH_BUFFER_LIMIT = 64 * 1024 * 1024
+MIN_SEGMENTED_SIZE = 16 * 1024 * 1024
+JOURNAL_INTERVAL = 4 * 1024 * 1024
+MAX_PARALLEL_DOWNLOADS = 2
+SPEED_LIMIT = 0.0
+JOB_SPEED_LIMIT = 0.0
+ADAPTIVE_CONNECTIONS = False
+MAX_CONNECTIONS = 16
+TUNE_INTERVAL = 2.0
+HTTP_TIMEOUT = (10, 30)
+HTTP_RETRIES = 4
+HTTP_BACKOFF = 0.5
+HTTP_BACKOFF_MAX = 8.0
+HTTP_POOL_SIZE = 32
+PAGE_DEADLINE = 30
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MIRROR_SAMPLE = 256 * 1024
+MIRROR_PROBE_DEADLINE = 8
+MIRROR_STALL_TIMEOUT = 10
+MIRROR_RETRIES = 1
+PROGRESS_INTERVAL = 0.1
+SPEED_WINDOW = 3.0
+
+# --- SIGNALS ---
+class Signal:
+    """Qt-free stand-in for pyqtSignal: declared on the class, connect()/emit() per instance.
+    Slots run on the emitting thread; the GUI re-emits through real Qt signals to reach its own thread."""
+    def __init__(self, *types):
+        self.types = types
+
+    def __set_name__(self, owner, name):
+        self.attr = '_signal_' + name
+
+    def __get__(self, obj, owner=None):
+        if obj is None: return self
+        bound = obj.__dict__.get(self.attr)
+        if bound is None: bound = obj.__dict__[self.attr] = BoundSignal()
+        return bound
+
+class BoundSignal:
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def disconnect(self, slot):
+        self.slots.remove(slot)
+
+    def emit(self, *args):
+        for slot in list(self.slots): slot(*args)
+
+# --- HTTP ---
+class HttpStats:
+    """Process-wide counters for every request made through HttpClient (and every body byte read by iter_body)"""
+    FIELDS = ('requests', 'retries', 'failures', 'connections_opened', 'bytes', 'backoff_seconds')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = dict.fromkeys(self.FIELDS, 0)
+
+    def add(self, field, amount=1):
+        with self.lock: self.counts[field] += amount
+
+    def snapshot(self):
+        with self.lock: counts = dict(self.counts)
+        counts['connections_reused'] = max(0, counts['requests'] - counts['connections_opened'])
+        return counts
+
+HTTP_STATS = HttpStats()
+
+def backoff_delay(attempt, retry_after=None):
+    """Exponential backoff with jitter (half fixed, half random), or the server's Retry-After when it gives one"""
+    if retry_after and retry_after.strip().isdigit(): return min(float(retry_after), HTTP_BACKOFF_MAX * 4)
+    cap = min(HTTP_BACKOFF_MAX, HTTP_BACKOFF * 2 ** attempt)
+    return cap / 2 + random.uniform(0, cap / 2)
+
+class DownloadError(IOError):
+    """A failure retrying cannot fix (the file changed on the server, a range request was refused, ...)"""
+
+class RetriesExhausted(DownloadError):
+    """HttpClient already retried the request as often (or as long) as it was allowed to"""
+
+class TransferInterrupted(IOError):
+    """A body that ended before all of its bytes arrived"""
+
+def is_transient(error):
+    """Network-level failures worth retrying: refused/reset/dropped connections, timeouts and truncated bodies.
+    Errors that would fail the same way again (a malformed URL, TLS failures, redirect loops, disk errors) are not."""
+    from requests import exceptions as requests_errors
+    from urllib3 import exceptions as urllib3_errors
+    if isinstance(error, (requests_errors.SSLError, urllib3_errors.SSLError)): return False
+    return isinstance(error, (requests_errors.ConnectionError, requests_errors.Timeout, requests_errors.ChunkedEncodingError,
+                              urllib3_errors.ProtocolError, urllib3_errors.TimeoutError, http.client.IncompleteRead,
+                              ConnectionError, TimeoutError, TransferInterrupted))
+
+REQUEST_TRACE = threading.local()  # connect timings of the request in flight on this thread
+
+def counting_pool(pool_class):
+    """A urllib3 pool class whose connections count every (re)connect in HTTP_STATS and time it for the request
+    that triggered it: _new_conn() (DNS lookup and TCP connect, which urllib3 does in one call) and the TLS
+    handshake after it. The address actually reached is read back from the socket."""
+    class CountingConnection(pool_class.ConnectionCls):
+        def _new_conn(self):
+            started = time.perf_counter()
+            sock = super()._new_conn()
+            REQUEST_TRACE.connect = time.perf_counter() - started
+            try: REQUEST_TRACE.peer = sock.getpeername()[0]
+            except OSError: pass
+            return sock
+
+        def connect(self):
+            HTTP_STATS.add('connections_opened')
+            started = time.perf_counter()
+            super().connect()
+            REQUEST_TRACE.tls = max(0.0, time.perf_counter() - started - REQUEST_TRACE.connect)
+    return type(pool_class.__name__, (pool_class,), {'ConnectionCls': CountingConnection})
+
+class HttpClient:
+    """The one pooled requests.Session all traffic goes through. get() retries connect errors, timeouts and
+    RETRY_STATUSES with jittered exponential backoff, within an optional per-request deadline (seconds for all
+    attempts, including the waits). requests is imported here rather than with this module: it is the slowest
+    import on the startup path.
+    Every response carries `timings` for its last attempt: connect (DNS + TCP) and tls, both 0 on a pooled
+    connection, and ttfb (request sent to headers received) in seconds; the peer address of a new connection;
+    and the retries it took."""
+    def __init__(self):
+        import requests
+        from urllib3 import connectionpool
+        self.session = requests.Session()
+        self.adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=HTTP_POOL_SIZE)
+        self.adapter.poolmanager.pool_classes_by_scheme = {
+            'http': counting_pool(connectionpool.HTTPConnectionPool),
+            'https': counting_pool(connectionpool.HTTPSConnectionPool)}
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+
+    def get(self, url, deadline=None, retries=HTTP_RETRIES, timeout=HTTP_TIMEOUT, **kwargs):
+        give_up = time.monotonic() + deadline if deadline else None
+        attempt = 0
+        while True:
+            attempt_timeout = timeout
+            if give_up:
+                remaining = give_up - time.monotonic()
+                if remaining <= 0: raise RetriesExhausted(f"Deadline of {deadline}s exceeded for {url}")
+                attempt_timeout = tuple(min(t, remaining) for t in timeout)
+            HTTP_STATS.add('requests')
+            REQUEST_TRACE.connect = REQUEST_TRACE.tls = 0.0
+            REQUEST_TRACE.peer = None
+            started = time.perf_counter()
+            try:
+                response = self.session.get(url, timeout=attempt_timeout, **kwargs)
+            except Exception as e:
+                if not is_transient(e): raise
+                if attempt >= retries:
+                    HTTP_STATS.add('failures')
+                    raise RetriesExhausted(str(e)) from e
+                delay = backoff_delay(attempt)
+            else:
+                connect, tls = REQUEST_TRACE.connect, REQUEST_TRACE.tls
+                response.timings = {'connect': connect, 'tls': tls, 'peer': REQUEST_TRACE.peer, 'retries': attempt,
+                                    'ttfb': max(0.0, time.perf_counter() - started - connect - tls)}
+                if response.status_code not in RETRY_STATUSES or attempt >= retries: return response
+                delay = backoff_delay(attempt, response.headers.get('Retry-After'))
+                response.close()
+            if give_up and time.monotonic() + delay >= give_up:
+                HTTP_STATS.add('failures')
+                raise RetriesExhausted(f"Deadline of {deadline}s exceeded for {url}")
+            attempt += 1
+            HTTP_STATS.add('retries')
+            HTTP_STATS.add('backoff_seconds', delay)
+            time.sleep(delay)
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+def http_client():
+    """The shared HttpClient, created on first use"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None: _http_client = HttpClient()
+        return _http_client
+
+# --- METRICS ---
+def is_stall(error):
+    """A transfer that stopped delivering data (a read timeout), as opposed to one refused or cut off"""
+    return isinstance(error, TimeoutError) or 'Timeout' in type(error).__name__ or 'timed out' in str(error)
+
+def timed_iter(iterable, totals, key):
+    """Yields from iterable, adding the seconds spent waiting on it to totals[key]"""
+    iterator = iter(iterable)
+    while True:
+        started = time.perf_counter()
+        try: item = next(iterator)
+        except StopIteration: return
+        finally: totals[key] += time.perf_counter() - started
+        yield item
+
+class TransferMetrics:
+    """What the metrics panel shows: per-phase timings of the last fetch of each index page, and one record per
+    download (live while it runs, then among the last METRICS_RECENT). Every finished page fetch and download
+    is also appended to METRICS_LOG as a JSON line, so slow sources and slow disks can be diagnosed later."""
+    PHASES = ('connect', 'tls', 'ttfb', 'body', 'parse')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.log_lock = threading.Lock()
+        self.pages = {}
+        self.active = []
+        self.recent = deque(maxlen=METRICS_RECENT)
+
+    def page(self, name, url, state, phases, peer=None):
+        entry = {'name': name, 'host': mirror_host(url), 'peer': peer, 'state': state,
+                 **{f"{phase}_ms": round(phases[phase] * 1000, 1) for phase in self.PHASES}}
+        with self.lock: self.pages[name] = dict(entry, time=time.time())
+        self.log({'event': 'page', **entry})
+
+    def start(self, name, url):
+        """A live record for one download; the Downloader adds to it with add()/update() and closes it with finish()"""
+        record = {'name': name, 'host': mirror_host(url), 'started': time.time(), 'clock': time.monotonic(),
+                  'received': 0, 'done': 0, 'total': 0, 'speed': 0.0, 'retries': 0, 'stalls': 0, 'write_s': 0.0}
+        with self.lock: self.active.append(record)
+        return record
+
+    def add(self, record, **amounts):
+        """record may be None (an engine method called outside _run_task, as the benchmarks do)"""
+        if record is None: return
+        with self.lock:
+            for field, amount in amounts.items(): record[field] += amount
+
+    def update(self, record, **values):
+        if record is None: return
+        with self.lock: record.update(values)
+
+    def finish(self, record, result):
+        with self.lock:
+            self.active = [other for other in self.active if other is not record]
+            record.update(seconds=time.monotonic() - record.pop('clock'), speed=0.0, result=result)
+            self.recent.appendleft(record)
+            entry = self._with_average(record)
+        self.log({'event': 'download', 'name': entry['name'], 'host': entry['host'], 'result': result,
+                  'bytes': entry['received'], 'total': entry['total'], 'seconds': round(entry['seconds'], 2),
+                  'avg_mbps': round(entry['average'] / 1e6, 2), 'retries': entry['retries'], 'stalls': entry['stalls'],
+                  'write_s': round(entry['write_s'], 3)})
+
+    @staticmethod
+    def _with_average(record):
+        elapsed = record['seconds'] if 'seconds' in record else time.monotonic() - record['clock']
+        return dict(record, average=record['received'] / elapsed if elapsed > 0 else 0.0)
+
+    def snapshot(self):
+        """{'pages': {name: entry}, 'downloads': running then recent records (with 'average' in bytes/s), 'http': counters}"""
+        with self.lock:
+            pages = {name: dict(entry) for name, entry in self.pages.items()}
+            downloads = [self._with_average(record) for record in list(self.active) + list(self.recent)]
+        return {'pages': pages, 'downloads': downloads, 'http': HTTP_STATS.snapshot()}
+
+    def log(self, entry):
+        line = json.dumps({'time': time.strftime('%Y-%m-%dT%H:%M:%S'), **entry})
+        try:
+            with self.log_lock:
+                os.makedirs(DATA_FOLDER, exist_ok=True)
+                if os.path.exists(METRICS_LOG) and os.path.getsize(METRICS_LOG) > METRICS_LOG_MAX:
+                    os.replace(METRICS_LOG, METRICS_LOG + '.1')
+                with open(METRICS_LOG, 'a') as f: f.write(line + '\n')
+        except OSError as e: print(f"Metrics Error: {e}")
+
+METRICS = TransferMetrics()
+
+# --- SETTINGS MANAGER ---
+def load_settings():
+    global DEFAULT_DOWNLOAD_PATH, SHOW_SPEED_IN_MBPS, ENABLE_NOTIFICATIONS, DOWNLOAD_CONNECTIONS, MAX_PARALLEL_DOWNLOADS
+    global SPEED_LIMIT, JOB_SPEED_LIMIT, ADAPTIVE_CONNECTIONS, KEYS_INSTALL_PATH, FW_INSTALL_PATH
+    global WATCH_ENABLED, WATCH_INTERVAL, WATCH_PREFETCH
+    if os.path.exists(SETTINGS_FILE):
+        try:
+            with open(SETTINGS_FILE, 'r') as f:
+                settings = json.load(f)
+                DEFAULT_DOWNLOAD_PATH = settings.get('default_download_path', DEFAULT_DOWNLOAD_PATH)
+                SHOW_SPEED_IN_MBPS = settings.get('show_speed_in_mbps', False)
+                ENABLE_NOTIFICATIONS = settings.get('enable_notifications', True)
+                DOWNLOAD_CONNECTIONS = max(1, int(settings.get('download_connections', DOWNLOAD_CONNECTIONS)))
+                MAX_PARALLEL_DOWNLOADS = max(1, int(settings.get('max_parallel_downloads', MAX_PARALLEL_DOWNLOADS)))
+                SPEED_LIMIT = max(0.0, float(settings.get('speed_limit', SPEED_LIMIT)))
+                JOB_SPEED_LIMIT = max(0.0, float(settings.get('job_speed_limit', JOB_SPEED_LIMIT)))
+                ADAPTIVE_CONNECTIONS = bool(settings.get('adaptive_connections', ADAPTIVE_CONNECTIONS))
+                KEYS_INSTALL_PATH = settings.get('keys_install_path', KEYS_INSTALL_PATH)
+                FW_INSTALL_PATH = settings.get('fw_install_path', FW_INSTALL_PATH)
+                WATCH_ENABLED = bool(settings.get('watch_enabled', WATCH_ENABLED))
+                WATCH_INTERVAL = max(5.0, float(settings.get('watch_interval', WATCH_INTERVAL)))
+                WATCH_PREFETCH = bool(settings.get('watch_prefetch', WATCH_PREFETCH))
+        except: pass
+
+def save_settings_to_file():
+    os.makedirs(DATA_FOLDER, exist_ok=True)
+    settings = {
+        'default_download_path': DEFAULT_DOWNLOAD_PATH,
+        'show_speed_in_mbps': SHOW_SPEED_IN_MBPS,
+        'enable_notifications': ENABLE_NOTIFICATIONS,
+        'download_connections': DOWNLOAD_CONNECTIONS,
+        'max_parallel_downloads': MAX_PARALLEL_DOWNLOADS,
+        'speed_limit': SPEED_LIMIT,
+        'job_speed_limit': JOB_SPEED_LIMIT,
+        'adaptive_connections': ADAPTIVE_CONNECTIONS,
+        'keys_install_path': KEYS_INSTALL_PATH,
+        'fw_install_path': FW_INSTALL_PATH,
+        'watch_enabled': WATCH_ENABLED,
+        'watch_interval': WATCH_INTERVAL,
+        'watch_prefetch': WATCH_PREFETCH
+    }
+    with open(SETTINGS_FILE, 'w') as f: json.dump(settings, f, indent=4)
+
+# --- CATALOG CACHE ---
+def load_catalog_cache():
+    if os.path.exists(CATALOG_CACHE_FILE):
+        try:
+            with open(CATALOG_CACHE_FILE, 'r') as f: return json.load(f)
+        except: pass
+    return {'saved_at': 0, 'pages': {}, 'final_list': []}
+
+def save_catalog_cache(cache):
+    os.makedirs(os.path.dirname(CATALOG_CACHE_FILE), exist_ok=True)
+    tmp_path = CATALOG_CACHE_FILE + '.tmp'
+    with open(tmp_path, 'w') as f: json.dump(cache, f)
+    os.replace(tmp_path, CATALOG_CACHE_FILE)
+
+def is_catalog_fresh(cache):
+    return bool(cache.get('final_list')) and time.time() - cache.get('saved_at', 0) < CATALOG_TTL
+
+# --- DOWNLOAD MANIFEST ---
+manifest_lock = threading.Lock()
+
+def load_manifest():
+    if os.path.exists(MANIFEST_FILE):
+        try:
+            with open(MANIFEST_FILE, 'r') as f: return json.load(f)
+        except: pass
+    return {}
+
+def record_verified(urls, path, sha256, validator):
+    """Remembers a verified archive under each of its mirror URLs, so a later download from any of them can reuse it"""
+    with manifest_lock:
+        manifest = load_manifest()
+        stat = os.stat(path)
+        for url in urls:
+            manifest[url] = {'path': os.path.abspath(path), 'size': stat.st_size, 'mtime': stat.st_mtime,
+                             'sha256': sha256, 'validator': validator, 'verified_at': time.time()}
+        os.makedirs(DATA_FOLDER, exist_ok=True)
+        tmp_path = MANIFEST_FILE + '.tmp'
+        with open(tmp_path, 'w') as f: json.dump(manifest, f, indent=4)
+        os.replace(tmp_path, MANIFEST_FILE)
+
+def find_verified(url, length, validator):
+    """Path of an untouched, verified copy of this URL's file (same size, mtime and server validator), or None"""
+    with manifest_lock: entry = load_manifest().get(url)
+    if not entry or (length and entry['size'] != length): return None
+    if validator.get('etag') and entry['validator'].get('etag') not in (None, validator['etag']): return None
+    try: stat = os.stat(entry['path'])
+    except OSError: return None
+    if stat.st_size != entry['size'] or abs(stat.st_mtime - entry['mtime']) > 1: return None
+    return entry['path']
+
+# --- MIRROR TIMINGS ---
+mirror_lock = threading.Lock()
+
+def mirror_host(url):
+    return urlsplit(url).netloc.lower()
+
+def load_mirror_stats():
+    if os.path.exists(MIRRORS_FILE):
+        try:
+            with open(MIRRORS_FILE, 'r') as f: return json.load(f)
+        except: pass
+    return {}
+
+def record_mirror(url, seconds=None, failed=False):
+    """Folds one result into the host's remembered timing. `seconds` is how long a MIRROR_SAMPLE probe took
+    (averaged with earlier probes); a failure counts against the host until its next success."""
+    with mirror_lock:
+        stats = load_mirror_stats()
+        entry = stats.setdefault(mirror_host(url), {'seconds': None, 'failures': 0})
+        if failed: entry['failures'] += 1
+        else:
+            if seconds is not None:
+                entry['seconds'] = seconds if entry['seconds'] is None else (entry['seconds'] + seconds) / 2
+            entry['failures'] = 0
+        entry['updated'] = time.time()
+        os.makedirs(os.path.dirname(MIRRORS_FILE), exist_ok=True)
+        tmp_path = MIRRORS_FILE + '.tmp'
+        with open(tmp_path, 'w') as f: json.dump(stats, f, indent=4)
+        os.replace(tmp_path, MIRRORS_FILE)
+
+def rank_mirrors(urls, failed_now=()):
+    """Fastest remembered host first; hosts that just failed a probe, have no timing yet or keep failing sink.
+    Ties keep the page's order."""
+    with mirror_lock: stats = load_mirror_stats()
+    def key(url):
+        entry = stats.get(mirror_host(url), {})
+        seconds = entry.get('seconds')
+        return (url in failed_now, seconds is None, (seconds or 0) * (1 + entry.get('failures', 0)))
+    return sorted(urls, key=key)
+
+# --- SCRAPER ENGINE ---
+class VersionTableParser:
+    """Incremental table scanner: feed() it text chunks and pop_rows() the (version, links) of every closed <tr>.
+    Only the unfinished tail of the page is buffered, and each byte is searched for a row end once."""
+    ROW_RE = re.compile(r'<tr.*?>(.*?)</tr>', re.DOTALL)
+    VERSION_RE = re.compile(r'<td[^>]*>\s*(v[\d\.]+)\s*</td>', re.IGNORECASE)
+    LINK_RE = re.compile(r'<a\s+href="([^"]+)"[^>]*>DOWNLOAD</a>', re.IGNORECASE)
+
+    def __init__(self):
+        self._buf = ""
+        self._scan_from = 0
+        self._done = []
+
+    def feed(self, chunk):
+        self._buf += chunk
+        close = self._buf.find('</tr>', self._scan_from)
+        if close == -1:
+            self._trim()
+            return
+        last = self._buf.rfind('</tr>') + 5
+        for m in self.ROW_RE.finditer(self._buf, 0, last):
+            row = m.group(1)
+            ver_match = self.VERSION_RE.search(row)
+            if not ver_match: continue
+            links = self.LINK_RE.findall(row)
+            if links: self._done.append((ver_match.group(1).strip(), links))
+        self._buf = self._buf[last:]
+        self._scan_from = 0
+        self._trim()
+
+    def _trim(self):
+        # Drop text that cannot be part of a row yet (keeping a possible split "<tr" / "</tr>")
+        start = self._buf.find('<tr')
+        if start == -1: start = max(len(self._buf) - 4, 0)
+        self._buf = self._buf[start:]
+        self._scan_from = max(len(self._buf) - 4, 0)
+
+    def close(self):
+        self._buf = ""
+
+    def pop_rows(self):
+        rows, self._done = self._done, []
+        return rows
+
+def iter_version_rows(chunks):
+    """Yields (version, links) as soon as each row closes; accepts a whole page or an iterable of text chunks"""
+    if isinstance(chunks, str): chunks = (chunks,)
+    parser = VersionTableParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from parser.pop_rows()
+    parser.close()
+    yield from parser.pop_rows()
+
+def iter_response_text(response, chunk_size=65536):
+    decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        HTTP_STATS.add('bytes', len(chunk))
+        yield decoder.decode(chunk)
+    yield decoder.decode(b'', final=True)
+
+def keys_row(ver, links): return [ver, links[0].strip()]
+
+def fw_row(ver, links): return [ver, links]
+
+def parse_keys_page(chunks):
+    """Returns [version, keys_url] pairs from the keys index page"""
+    return [keys_row(ver, links) for ver, links in iter_version_rows(chunks)]
+
+def parse_fw_page(chunks):
+    """Returns [version, [links...]] pairs from the firmware index page"""
+    return [fw_row(ver, links) for ver, links in iter_version_rows(chunks)]
+
+def merge_catalog(keys_rows, fw_rows):
+    merged_data, by_lower = {}, {}
+    for ver, url in keys_rows:
+        if ver not in merged_data:
+            merged_data[ver] = {'version': ver}
+            by_lower.setdefault(ver.lower(), ver)
+        merged_data[ver]['keys_url'] = url
+
+    for ver, links in fw_rows:
+        norm_ver = ver.replace('V', 'v')
+        target_key = by_lower.setdefault(norm_ver.lower(), norm_ver)
+        if target_key not in merged_data: merged_data[target_key] = {'version': target_key}
+        merged_data[target_key]['fw_url'] = links[0]
+        merged_data[target_key]['fw_mirrors'] = list(dict.fromkeys(links))
+
+    def sort_key(item):
+        v_str = item['version'].lower().replace('v', '')
+        try: return [int(x) for x in v_str.split('.')]
+        except: return [0]
+
+    return sorted(merged_data.values(), key=sort_key, reverse=True)
+
+class ProdKeysScraper:
+    """Fetches and merges both index pages. fetch_data() can run on any thread: rows_ready carries the catalog
+    as far as it is known while the pages are parsed, and cancel() makes a running fetch stop early and return
+    None without touching the cache."""
+    status_update = Signal(str)
+    rows_ready = Signal(list)
+    HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+    def __init__(self):
+        self.page_timings = {}
+        self.cache = load_catalog_cache()
+        self.cancelled = threading.Event()
+        self.rows_lock = threading.Lock()
+        self.live, self.stand_in, self.finished = {}, {}, set()
+        self.last_rows, self.last_snapshot = 0.0, None
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def load_cached(self):
+        """Returns the last merged list saved on disk (empty if there is none)"""
+        self.cache = load_catalog_cache()
+        return self.cache.get('final_list', [])
+
+    def _fetch_page(self, name, url, to_row):
+        """Revalidates one index page against the cache; only re-parses when the page changed"""
+        start = time.perf_counter()
+        cached = self.cache['pages'].get(name, {})
+        if cached.get('url') != url: cached = {}
+        with self.rows_lock: self.stand_in[name] = cached.get('rows')
+        headers = dict(self.HEADERS)
+        if cached.get('etag'): headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'): headers['If-Modified-Since'] = cached['last_modified']
+
+        page, state = cached, "cached"
+        phases, peer = dict.fromkeys(TransferMetrics.PHASES, 0.0), None
+        try:
+            with http_client().get(url, headers=headers, deadline=PAGE_DEADLINE, stream=True) as r:
+                phases.update((phase, r.timings[phase]) for phase in ('connect', 'tls', 'ttfb'))
+                peer = r.timings['peer']
+                if r.status_code == 304 and cached: state = "not modified"
+                elif r.status_code == 200:
+                    rows = []
+                    with self.rows_lock: self.live[name] = rows
+                    body_started = time.perf_counter()
+                    chunks = takewhile(lambda _: not self.cancelled.is_set(), timed_iter(iter_response_text(r), phases, 'body'))
+                    for ver, links in iter_version_rows(chunks):
+                        with self.rows_lock: rows.append(to_row(ver, links))
+                        self._publish_rows()
+                    if self.cancelled.is_set(): return cached, "cancelled"
+                    phases['parse'] = time.perf_counter() - body_started - phases['body']
+                    page = {'url': url, 'etag': r.headers.get('ETag'),
+                            'last_modified': r.headers.get('Last-Modified'), 'rows': rows}
+                    state = "updated"
+        except Exception as e: print(f"{name} Error: {e}")
+        elapsed = time.perf_counter() - start
+        self.page_timings[name] = elapsed
+        METRICS.page(name, url, state, phases, peer)
+        self.status_update.emit(f"{name} page: {elapsed:.2f}s ({state})")
+        with self.rows_lock:
+            self.live[name] = page.get('rows', [])
+            self.finished.add(name)
+        self._publish_rows(force=True)
+        return page, state
+
+    def _publish_rows(self, force=False):
+        """Emits the catalog as far as it is known: a finished page's rows, and for a page still loading its
+        cached rows (or, with no cache, the rows parsed so far). At most every PROGRESS_INTERVAL unless forced,
+        and only when the list changed."""
+        with self.rows_lock:
+            now = time.monotonic()
+            if not force and now - self.last_rows < PROGRESS_INTERVAL: return
+            self.last_rows = now
+            keys_rows, fw_rows = (self.live.get(name, []) if name in self.finished or not self.stand_in.get(name)
+                                  else self.stand_in[name] for name in ("Keys", "Firmware"))
+            snapshot = merge_catalog(keys_rows, fw_rows)
+            if snapshot == self.last_snapshot or self.cancelled.is_set(): return
+            self.last_snapshot = snapshot
+            # Emitted under the lock so the two page threads cannot deliver snapshots out of order
+            self.rows_ready.emit(snapshot)
+
+    def fetch_data(self):
+        """Revalidates both pages side by side; returns the merged catalog, or None if cancel() was called"""
+        self.page_timings = {}
+        with self.rows_lock:
+            self.live, self.stand_in, self.finished = {}, {}, set()
+            self.last_rows, self.last_snapshot = 0.0, self.cache.get('final_list')
+        self.status_update.emit("Fetching Keys & Firmware...")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            keys_job = pool.submit(self._fetch_page, "Keys", KEYS_URL, keys_row)
+            fw_job = pool.submit(self._fetch_page, "Firmware", FW_URL, fw_row)
+            (keys_page, keys_state), (fw_page, fw_state) = keys_job.result(), fw_job.result()
+        if self.cancelled.is_set(): return None
+        print(" | ".join(f"{name}: {t:.2f}s" for name, t in self.page_timings.items()))
+
+        if keys_state == fw_state == "not modified" and self.cache.get('final_list') and \
+                self.cache.get('format') == CATALOG_FORMAT:
+            final_list = self.cache['final_list']
+        else:
+            final_list = merge_catalog(keys_page.get('rows', []), fw_page.get('rows', []))
+        if "updated" in (keys_state, fw_state) or keys_state == fw_state == "not modified":
+            self.cache = {'saved_at': time.time(), 'pages': {'Keys': keys_page, 'Firmware': fw_page},
+                          'final_list': final_list, 'format': CATALOG_FORMAT}
+            try: save_catalog_cache(self.cache)
+            except Exception as e: print(f"Cache Error: {e}")
+        self.status_update.emit("Ready")
+        return final_list
+
+# --- DOWNLOAD ENGINE ---
+def format_speed(bytes_per_sec):
+    return f"{(bytes_per_sec * 8) / 1000000:.1f} Mbps" if SHOW_SPEED_IN_MBPS else f"{bytes_per_sec / 1000000:.1f} MB/s"
+
+def split_ranges(ranges, segment_size=SEGMENT_SIZE):
+    """Cuts inclusive (start, end) byte ranges into pieces of at most segment_size"""
+    return [(start, min(start + segment_size - 1, end)) for r_start, end in ranges
+            for start in range(r_start, end + 1, segment_size)]
+
+def merge_ranges(ranges):
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1: merged[-1][1] = max(merged[-1][1], end)
+        else: merged.append([start, end])
+    return merged
+
+def missing_ranges(total_length, done):
+    """Inclusive byte ranges of [0, total_length) not covered by done"""
+    missing, pos = [], 0
+    for start, end in merge_ranges(done):
+        if start > pos: missing.append((pos, start - 1))
+        pos = max(pos, end + 1)
+    if pos < total_length: missing.append((pos, total_length - 1))
+    return missing
+
+_io_buffers = threading.local()
+
+def iter_body(response, max_read=IO_BUFFER_SIZE):
+    """Yields memoryview slices of a per-thread IO_BUFFER_SIZE bytearray, filled straight from the socket with
+    readinto. Slices are only valid until the next one is requested. Read sizes start at 64 KiB and adapt to
+    the link (never above max_read) so slow or throttled hosts still report progress and notice a stop quickly.
+    max_read may also be a callable, asked again before every read so a limit changed mid-transfer applies at once."""
+    limit = max_read if callable(max_read) else lambda: max_read
+    buffer = getattr(_io_buffers, 'buffer', None)
+    if buffer is None: buffer = _io_buffers.buffer = bytearray(IO_BUFFER_SIZE)
+    raw = getattr(response.raw, '_fp', None)
+    if raw is None or not hasattr(raw, 'readinto') or \
+            response.headers.get('Content-Encoding', 'identity').lower() not in ('identity', ''):
+        for chunk in response.iter_content(chunk_size=min(256 * 1024, limit())):
+            HTTP_STATS.add('bytes', len(chunk))
+            yield chunk
+        return
+    view, size = memoryview(buffer), 64 * 1024
+    while True:
+        max_read = min(limit(), len(buffer))
+        size = min(size, max_read)
+        started = time.monotonic()
+        n = raw.readinto(view[:size])
+        if not n: break
+        HTTP_STATS.add('bytes', n)
+        yield view[:n]
+        took = time.monotonic() - started
+        if took < 0.05 and n == size: size = min(size * 2, max_read)
+        elif took > 0.25: size = max(size // 2, min(64 * 1024, max_read))
+    if raw.isclosed() and not getattr(raw, 'length', None):
+        # The whole body was read behind urllib3's back: mark it consumed so the connection goes back to the pool
+        response._content_consumed = True
+        response.raw.release_conn()
+
+class StreamHasher:
+    """SHA-256 of a file assembled from byte ranges that may arrive out of order, computed as data arrives.
+    Data at the frontier is hashed at once and later ranges wait in memory; ranges that were already on disk
+    (a resumed download) are read back in IO_BUFFER_SIZE blocks as soon as the frontier reaches them, starting
+    with the prefix on disk when the hasher is created. If waiting data would exceed
+    HASH_BUFFER_LIMIT the hasher gives up on streaming and finish() reads the file back instead.
+    `sink`, if given, is called with every block in file order as it is hashed (StreamExtractor.feed)."""
+    def __init__(self, path, on_disk=(), sink=None):
+        self.path = path
+        self.sink = sink
+        self.sha = hashlib.sha256()
+        self.offset = 0
+        self.pending, self.pending_bytes = {}, 0
+        self.on_disk = {start: end for start, end in merge_ranges(on_disk)}
+        self.overflowed = False
+        self.lock = threading.Lock()
+        self._drain()
+
+    def feed(self, offset, data):
+        with self.lock:
+            if self.overflowed: return
+            if offset == self.offset:
+                self.sha.update(data)
+                if self.sink: self.sink(data)
+                self.offset += len(data)
+                self._drain()
+            elif offset > self.offset:
+                self.pending[offset] = bytes(data)
+                self.pending_bytes += len(data)
+                if self.pending_bytes > HASH_BUFFER_LIMIT:
+                    self.overflowed, self.pending, self.pending_bytes = True, {}, 0
+
+    def _drain(self):
+        while True:
+            if self.offset in self.pending:
+                data = self.pending.pop(self.offset)
+                self.pending_bytes -= len(data)
+            elif self.offset in self.on_disk:
+                self._read_back(self.on_disk.pop(self.offset))
+                continue
+            else: return
+            self.sha.update(data)
+            if self.sink: self.sink(data)
+            self.offset += len(data)
+
+    def _read_back(self, end):
+        """Hashes bytes offset..end from the file itself"""
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            while self.offset <= end:
+                data = f.read(min(IO_BUFFER_SIZE, end - self.offset + 1))
+                if not data: raise IOError(f"{self.path} is shorter than its journal")
+                self.sha.update(data)
+                if self.sink: self.sink(data)
+                self.offset += len(data)
+
+    def finish(self, length):
+        """Returns the hex digest; raises if the bytes seen do not add up to `length`"""
+        with self.lock:
+            self._drain()
+            if self.overflowed:
+                self.sha, self.offset = hashlib.sha256(), 0
+                with open(self.path, 'rb') as f:
+                    while (block := f.read(IO_BUFFER_SIZE)):
+                        self.sha.update(block)
+                        self.offset += len(block)
+            if length and self.offset != length:
+                raise IOError(f"Verification failed: got {self.offset} of {length} bytes")
+            return self.sha.hexdigest()
+
+def lower_thread_priority():
+    """Best effort: puts the calling thread at background priority (on Windows that includes its disk I/O).
+    Only used on short-lived pool threads, since an unprivileged thread cannot raise its priority again."""
+    try:
+        if os.name == 'nt':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 0x00010000)  # THREAD_MODE_BACKGROUND_BEGIN
+        else: os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 10)
+    except Exception: pass
+
+def check_archive(path, name):
+    """Cheap structural check of a finished zip: the central directory must parse and fit inside the file"""
+    if not name.lower().endswith('.zip'): return
+    size = os.path.getsize(path)
+    try:
+        with zipfile.ZipFile(path) as zf:
+            entries = zf.infolist()
+            if not entries: raise IOError(f"{name} is an empty archive")
+            for info in entries:
+                if info.header_offset + info.compress_size > size: raise IOError(f"{name} is truncated")
+    except zipfile.BadZipFile as e: raise IOError(f"{name} is not a valid zip ({e})")
+
+ZIP_LOCAL_HEADER = struct.Struct('<4sHHHHHIIIHH')
+
+def member_path(root, name):
+    """Where an archive member goes under root, or None if its name would escape root"""
+    parts = [part for part in name.replace('\\', '/').split('/') if part not in ('', '.')]
+    if not parts or '..' in parts or ':' in parts[0]: return None
+    return os.path.join(root, *parts)
+
+def file_crc32(path):
+    crc = 0
+    with open(path, 'rb') as f:
+        while (block := f.read(IO_BUFFER_SIZE)): crc = zlib.crc32(block, crc)
+    return crc
+
+def is_unchanged(path, size, crc):
+    """True if path already holds exactly this member (same size and CRC-32)"""
+    try: return os.path.getsize(path) == size and file_crc32(path) == crc
+    except OSError: return False
+
+class StreamExtractor:
+    """Unpacks a zip into `target` while it is still downloading. Fed the archive in file order (as the
+    StreamHasher's sink), it walks the local file headers and inflates each member into a staging folder,
+    skipping members the target already has with the same size and CRC-32. The target's own files are only
+    touched by install(), after the archive is verified. Anything the stream walk cannot follow (encryption,
+    other compression methods, stored members with trailing sizes, a hasher that stopped streaming) is left
+    to install(), which then unpacks the finished file instead."""
+    def __init__(self, target, name):
+        self.target = target
+        self.staging = os.path.join(target, f'.staging-{name}')
+        self.buffer = bytearray()
+        self.entry = None
+        self.staged, self.unchanged = {}, set()
+        self.done, self.fallback = False, False
+        shutil.rmtree(self.staging, ignore_errors=True)
+
+    def feed(self, data):
+        if self.done or self.fallback: return
+        view = memoryview(data)
+        try:
+            while len(view) and not (self.done or self.fallback):
+                if self.entry is None: view = self._header(view)
+                elif self.entry['trailer']: view = self._trailer(view)
+                else: view = self._data(view)
+        except Exception as e:
+            print(f"Extract Error: {e}, unpacking after the download instead")
+            self._abandon()
+
+    def _take(self, view, size):
+        """Collects header bytes across feeds; returns (the first `size` bytes or None, the unused rest)"""
+        need = size - len(self.buffer)
+        if need > 0:
+            self.buffer += view[:need]
+            view = view[need:]
+        return (bytes(self.buffer[:size]) if len(self.buffer) >= size else None), view
+
+    def _header(self, view):
+        head, view = self._take(view, ZIP_LOCAL_HEADER.size)
+        if head is None: return view
+        signature, _, flags, method, _, _, crc, packed, size, name_len, extra_len = ZIP_LOCAL_HEADER.unpack(head)
+        if signature != b'PK\x03\x04':
+            # The central directory follows the last member
+            if signature in (b'PK\x01\x02', b'PK\x05\x06', b'PK\x06\x06'): self.done = True
+            else: self.fallback = True
+            return view
+        head, view = self._take(view, ZIP_LOCAL_HEADER.size + name_len + extra_len)
+        if head is None: return view
+        self.buffer.clear()
+        name = head[30:30 + name_len].decode('utf-8' if flags & 0x800 else 'cp437')
+        extra, zip64 = head[30 + name_len:], False
+        while len(extra) >= 4:
+            tag, length = struct.unpack('<HH', extra[:4])
+            if tag == 1 and length >= 16:
+                size, packed = struct.unpack('<QQ', extra[4:20])
+                zip64 = True
+            extra = extra[4 + length:]
+        trailing = bool(flags & 0x08)
+        path = member_path(self.staging, name)
+        if flags & 0x01 or method not in (0, 8) or (trailing and method == 0) or path is None:
+            self.fallback = True
+            return view
+        entry = {'name': name, 'path': path, 'crc': crc, 'size': size, 'left': None if trailing else packed,
+                 'zip64': zip64, 'trailer': False, 'seen_crc': 0, 'written': 0, 'file': None,
+                 'inflater': zlib.decompressobj(-15) if method == 8 else None}
+        if name.endswith('/'): entry['inflater'] = None
+        elif not trailing and is_unchanged(member_path(self.target, name), size, crc): self.unchanged.add(name)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            entry['file'] = open(path, 'wb')
+        self.entry = entry
+        if entry['left'] == 0: self._end_entry()
+        return view
+
+    def _data(self, view):
+        entry = self.entry
+        if entry['left'] is not None:
+            chunk, view = view[:entry['left']], view[entry['left']:]
+            entry['left'] -= len(chunk)
+            if entry['file']: self._inflate(entry, chunk)
+            if entry['left'] == 0: self._end_entry()
+            return view
+        # Sizes come after the data: the deflate stream's own end marks the end of the member
+        self._inflate(entry, view)
+        if not entry['inflater'].eof: return view[len(view):]
+        entry['trailer'] = True
+        return memoryview(entry['inflater'].unused_data)
+
+    def _inflate(self, entry, data):
+        inflater = entry['inflater']
+        while True:
+            out = inflater.decompress(data, IO_BUFFER_SIZE) if inflater else data
+            entry['file'].write(out)
+            entry['seen_crc'] = zlib.crc32(out, entry['seen_crc'])
+            entry['written'] += len(out)
+            data = inflater.unconsumed_tail if inflater else b''
+            if not data or inflater.eof: return
+
+    def _trailer(self, view):
+        """The data descriptor after a member written with trailing sizes, with or without its signature"""
+        entry, body = self.entry, 20 if self.entry['zip64'] else 12
+        head, view = self._take(view, 4)
+        if head is None: return view
+        skip = 4 if head == b'PK\x07\x08' else 0
+        head, view = self._take(view, skip + body)
+        if head is None: return view
+        self.buffer.clear()
+        entry['crc'] = struct.unpack('<I', head[skip:skip + 4])[0]
+        entry['size'] = struct.unpack('<Q' if entry['zip64'] else '<I', head[skip + body - (8 if entry['zip64'] else 4):])[0]
+        self._end_entry()
+        return view
+
+    def _end_entry(self):
+        entry, self.entry = self.entry, None
+        if entry['file'] is None: return
+        entry['file'].close()
+        if (entry['inflater'] and not entry['inflater'].eof) or \
+                (entry['seen_crc'], entry['written']) != (entry['crc'], entry['size']):
+            self.fallback = True
+            return
+        self.staged[entry['name']] = (entry['size'], entry['crc'])
+
+    def _abandon(self):
+        self.fallback = True
+        if self.entry and self.entry['file']: self.entry['file'].close()
+
+    def discard(self):
+        """Drops the staging folder, e.g. after a failed or stopped download"""
+        self._abandon()
+        shutil.rmtree(self.staging, ignore_errors=True)
+
+    def install(self, archive_path):
+        """Completes the staging folder from the verified archive if the stream walk missed anything, then moves
+        every changed member into the target. Returns (installed, unchanged) file counts."""
+        try:
+            with zipfile.ZipFile(archive_path) as zf:
+                members = [info for info in zf.infolist() if not info.is_dir()]
+                if self.fallback or not self.done or self.entry or \
+                        {info.filename for info in members} != set(self.staged) | self.unchanged:
+                    self._unpack(zf, members)
+            installed = 0
+            for name, (size, crc) in self.staged.items():
+                dest = member_path(self.target, name)
+                if is_unchanged(dest, size, crc):
+                    self.unchanged.add(name)
+                    continue
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                os.replace(member_path(self.staging, name), dest)
+                installed += 1
+            return installed, len(self.unchanged)
+        finally: self.discard()
+
+    def _unpack(self, zf, members):
+        self._abandon()
+        shutil.rmtree(self.staging, ignore_errors=True)
+        self.staged, self.unchanged = {}, set()
+        for info in members:
+            path = member_path(self.staging, info.filename)
+            if path is None: raise IOError(f"Unsafe path in archive: {info.filename}")
+            if is_unchanged(member_path(self.target, info.filename), info.file_size, info.CRC):
+                self.unchanged.add(info.filename)
+                continue
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            try:
+                with zf.open(info) as src, open(path, 'wb') as dst: shutil.copyfileobj(src, dst, IO_BUFFER_SIZE)
+            except (zipfile.BadZipFile, NotImplementedError, RuntimeError) as e: raise IOError(f"Could not unpack {info.filename} ({e})")
+            self.staged[info.filename] = (info.file_size, info.CRC)
+
+class SpeedMeter:
+    """Transfer rate over the last `window` seconds rather than the lifetime average"""
+    def __init__(self, window=SPEED_WINDOW):
+        self.window = window
+        self.samples = deque()
+
+    def update(self, total_bytes, now):
+        self.samples.append((now, total_bytes))
+        while len(self.samples) > 2 and now - self.samples[0][0] > self.window: self.samples.popleft()
+        then, then_bytes = self.samples[0]
+        return (total_bytes - then_bytes) / (now - then) if now > then else 0.0
+
+class TokenBucket:
+    """Thread-safe byte budget refilled at rate() bytes/s (0 = unlimited). consume() takes the bytes at once and
+    sleeps off any debt, so threads sharing a bucket get the rate between them. Idle time only builds up
+    `burst` seconds of credit, so a pause is not followed by an unthrottled spike. consume() returns whether it
+    had to wait."""
+    def __init__(self, rate, burst=0.25):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = 0.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def consume(self, n, running=lambda: True):
+        with self.lock:
+            rate, now = self.rate(), time.monotonic()
+            if rate <= 0:
+                self.tokens, self.updated = 0.0, now
+                return False
+            self.tokens = min(self.tokens + (now - self.updated) * rate, rate * self.burst) - n
+            self.updated = now
+            delay = -self.tokens / rate if self.tokens < 0 else 0.0
+        waited = delay > 0
+        while delay > 0 and running():
+            time.sleep(min(delay, PROGRESS_INTERVAL))
+            delay -= PROGRESS_INTERVAL
+        return waited
+
+GLOBAL_BUCKET = TokenBucket(lambda: SPEED_LIMIT * 1000000)
+
+class ConnectionTuner:
+    """ADAPTIVE_CONNECTIONS: hill-climbs the number of parallel range requests. Every TUNE_INTERVAL the last
+    interval's throughput is compared with the one before: a clear gain keeps the direction, a clear loss
+    turns around, and a flat result steps down, since extra connections that add nothing only cost the host.
+    A failed request steps down straight away."""
+    def __init__(self, start, maximum=MAX_CONNECTIONS):
+        self.target, self.maximum = start, maximum
+        self.step = 1
+        self.last_rate = None
+        self.mark = None
+
+    def update(self, total_bytes, now):
+        if self.mark is None: self.mark = (now, total_bytes)
+        then, then_bytes = self.mark
+        if now - then < TUNE_INTERVAL: return self.target
+        rate = (total_bytes - then_bytes) / (now - then)
+        self.mark = (now, total_bytes)
+        if self.last_rate is not None:
+            if rate < self.last_rate * 0.95: self.step = -self.step
+            elif rate <= self.last_rate * 1.05: self.step = -1
+        self.last_rate = rate
+        self.target = min(max(self.target + self.step, 1), self.maximum)
+        return self.target
+
+    def error(self):
+        """A range request failed: drop a connection at once and restart the comparison from there"""
+        self.target = max(1, self.target - 1)
+        self.step, self.last_rate, self.mark = -1, None, None
+
+class DownloadJournal:
+    """Sidecar <file>.part.json recording what is being fetched and which byte ranges are already on disk"""
+    def __init__(self, path):
+        self.path = path
+        self.url, self.length, self.validator, self.done = None, 0, {}, []
+        self.discarded = False
+        self.lock = threading.Lock()
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f: data = json.load(f)
+            self.url, self.length = data['url'], data['length']
+            self.validator, self.done = data.get('validator', {}), data.get('done', [])
+        except: self.url, self.length, self.validator, self.done = None, 0, {}, []
+        return self
+
+    def matches(self, url, length, validator):
+        if self.url != url or self.length != length: return False
+        if validator.get('etag') and self.validator.get('etag'): return validator['etag'] == self.validator['etag']
+        return validator.get('last_modified') == self.validator.get('last_modified')
+
+    def reset(self, url, length, validator):
+        self.url, self.length, self.validator, self.done = url, length, validator, []
+
+    def add(self, start, end):
+        with self.lock: self.done = merge_ranges(self.done + [[start, end]])
+
+    def save(self):
+        if self.discarded: return
+        with self.lock:
+            data = {'url': self.url, 'length': self.length, 'validator': self.validator, 'done': self.done}
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f: json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def remove(self):
+        try: os.remove(self.path)
+        except FileNotFoundError: pass
+
+    def discard(self):
+        """Forgets the partial file for good, e.g. when the server copy changed"""
+        self.discarded = True
+        self.remove()
+
+class Downloader:
+    """Downloads a batch of (url, save_path) tasks. run() blocks until they are done, or until is_running
+    is cleared from another thread, and reports through the signals below. A task's url may be a list of
+    mirrors of the same file (see _download_mirrored). `install_dirs` optionally gives each task a folder its
+    zip is unpacked into while it downloads (see StreamExtractor). A low_priority engine (watch mode prefetch)
+    runs one task and one connection at a time on background-priority threads."""
+    progress = Signal(int, str)
+    task_progress = Signal(int, int, str)
+    finished = Signal(bool, str)
+    stopped = Signal()
+
+    def __init__(self, download_tasks, install_dirs=None, low_priority=False):
+        self.tasks = download_tasks
+        self.names = [os.path.basename(save_path) for _, save_path in download_tasks]
+        self.install_dirs = [path if path and name.lower().endswith('.zip') else None
+                             for path, name in zip(install_dirs or [None] * len(download_tasks), self.names)]
+        self.extractors = [None for _ in download_tasks]
+        self.mirrors = [list(url) if isinstance(url, (list, tuple)) else [url] for url, _ in download_tasks]
+        self.retries = [HTTP_RETRIES for _ in download_tasks]
+        self.timeouts = [HTTP_TIMEOUT for _ in download_tasks]
+        self.records = [None] * len(download_tasks)
+        self.low_priority = low_priority
+        self.stats = [{'done': 0, 'total': 0, 'speed': 0.0} for _ in download_tasks]
+        self.stats_lock = threading.Lock()
+        self.meters = [SpeedMeter() for _ in download_tasks]
+        self.last_emit = [0.0 for _ in download_tasks]
+        self.throttled = [0.0 for _ in download_tasks]
+        self.errors = []
+        self.is_running = True
+        self.http = http_client()
+        self.buckets = [TokenBucket(lambda: JOB_SPEED_LIMIT * 1000000) for _ in download_tasks]
+
+    def run(self):
+        """Runs the tasks side by side, at most MAX_PARALLEL_DOWNLOADS at a time"""
+        with ThreadPoolExecutor(max_workers=1 if self.low_priority else max(1, MAX_PARALLEL_DOWNLOADS)) as pool:
+            jobs = [pool.submit(self._run_task, i, url, save_path) for i, (url, save_path) in enumerate(self.tasks)]
+            for job in jobs: job.result()
+        if not self.is_running:
+            self.stopped.emit()
+            return
+        if self.errors: self.finished.emit(False, f"Failed: {'; '.join(self.errors)}")
+        else: self.finished.emit(True, "All Downloads Complete")
+
+    def _run_task(self, index, url, save_path):
+        if not self.is_running: return
+        if self.low_priority: lower_thread_priority()
+        filename = self.names[index]
+        record = self.records[index] = METRICS.start(filename, self.mirrors[index][0])
+        outcome = "Stopped"
+        self._publish(index, 0, f"Starting {filename}...")
+        try:
+            if (result := self._download_mirrored(index, save_path)):
+                if self.install_dirs[index]: result = self._install(index, save_path, result)
+                with self.stats_lock: self.stats[index].update(done=self.stats[index]['total'], speed=0.0)
+                self._publish(index, 100, f"{filename} {result}")
+                outcome = result
+        except Exception as e:
+            with self.stats_lock: self.stats[index]['speed'] = 0.0
+            self.errors.append(str(e) if len(self.tasks) == 1 else f"{filename}: {e}")
+            self._publish(index, -1, f"{filename} Failed")
+            outcome = f"Failed: {e}"
+        finally:
+            if self.extractors[index]: self.extractors[index].discard()
+            METRICS.finish(record, outcome)
+
+    def _download_mirrored(self, index, save_path):
+        """Downloads from the task's mirrors, raced and fastest first. While another mirror is left, reads that
+        stall for MIRROR_STALL_TIMEOUT fail and only MIRROR_RETRIES retries are spent before moving on."""
+        mirrors = self.mirrors[index]
+        if len(mirrors) > 1:
+            if self._reuse_mirrored(index, save_path): return "Already downloaded (verified)"
+            mirrors = self._race(index, mirrors)
+        for position, url in enumerate(mirrors):
+            last = position == len(mirrors) - 1
+            self.retries[index] = HTTP_RETRIES if last else MIRROR_RETRIES
+            self.timeouts[index] = HTTP_TIMEOUT if last else (HTTP_TIMEOUT[0], MIRROR_STALL_TIMEOUT)
+            try: result = self._download(index, url, save_path)
+            except Exception as e:
+                if last or not self.is_running: raise
+                if len(mirrors) > 1: record_mirror(url, failed=True)
+                if is_stall(e): METRICS.add(self.records[index], stalls=1)
+                self._publish(index, 0, f"{mirror_host(url)} failed ({type(e).__name__}), trying {mirror_host(mirrors[position + 1])}...")
+                continue
+            if len(mirrors) > 1 and result: record_mirror(url)
+            return result
+
+    def _race(self, index, mirrors):
+        """Probes every mirror at once: time to first byte plus a MIRROR_SAMPLE read. Returns them ranked by
+        their timings (this race folded into the remembered ones), failed probes last."""
+        self._publish(index, 0, f"Testing {len(mirrors)} mirrors for {self.names[index]}...")
+        def probe(url):
+            started = time.monotonic()
+            try:
+                with self.http.get(url, headers={'Range': f'bytes=0-{MIRROR_SAMPLE - 1}'}, stream=True, retries=0,
+                                   deadline=MIRROR_PROBE_DEADLINE) as r:
+                    r.raise_for_status()
+                    received = 0
+                    for chunk in iter_body(r, 64 * 1024):
+                        received += len(chunk)
+                        if received >= MIRROR_SAMPLE or time.monotonic() - started > MIRROR_PROBE_DEADLINE: break
+                if not received: raise IOError("empty response")
+                # Normalised to a full sample, so a host that sent a short body is not flattered
+                record_mirror(url, (time.monotonic() - started) * max(1.0, MIRROR_SAMPLE / received))
+                return None
+            except Exception:
+                record_mirror(url, failed=True)
+                return url
+        with ThreadPoolExecutor(max_workers=len(mirrors)) as pool: failed = set(pool.map(probe, mirrors)) - {None}
+        return rank_mirrors(mirrors, failed)
+
+    def _download(self, index, url, save_path):
+        """Downloads into <file>.part, resuming from its journal when the host serves byte ranges, hashing as
+        data arrives. Verifies and renames the finished file into place, then records it in the manifest.
+        Returns the completion text, or None if stopped part-way."""
+        part_path = save_path + '.part'
+        journal = DownloadJournal(part_path + '.json')
+        METRICS.update(self.records[index], host=mirror_host(url))
+        info = self._probe(url)
+        if info['ranged']:
+            if self._reuse(index, url, save_path, info['length'], info['validator']): return "Already downloaded (verified)"
+            journal.load()
+            resumable = journal.matches(url, info['length'], info['validator']) and \
+                os.path.exists(part_path) and os.path.getsize(part_path) == info['length']
+            if not resumable:
+                journal.reset(url, info['length'], info['validator'])
+                with open(part_path, 'wb') as f: f.truncate(info['length'])
+            hasher = self._new_hasher(index, part_path, journal.done)
+            todo = missing_ranges(info['length'], journal.done)
+            connections = 1
+            if DOWNLOAD_CONNECTIONS > 1 and info['length'] >= MIN_SEGMENTED_SIZE and not self.low_priority:
+                todo, connections = split_ranges(todo), DOWNLOAD_CONNECTIONS
+            journal.save()
+            self._download_ranges(index, info['url'], part_path, todo, connections, journal, hasher)
+            length, validator = info['length'], info['validator']
+        else:
+            journal.remove()
+            reused = lambda length, validator: self._reuse(index, url, save_path, length, validator)
+            for attempt in range(self.retries[index] + 1):
+                hasher = self._new_hasher(index, part_path)
+                try:
+                    length, validator = self._download_stream(index, url, part_path, hasher, reused)
+                    break
+                except Exception as e:
+                    # Without byte ranges a broken transfer can only start over
+                    if not is_transient(e) or attempt == self.retries[index] or not self.is_running: raise
+                    self._wait_retry(index, attempt, e)
+            if length is None: return "Already downloaded (verified)"
+        if not self.is_running: return None
+        self._publish(index, 100, f"Verifying {self.names[index]}...")
+        try:
+            digest = hasher.finish(length)
+            check_archive(part_path, self.names[index])
+        except IOError:
+            journal.discard()
+            os.remove(part_path)
+            raise
+        os.replace(part_path, save_path)
+        journal.remove()
+        record_verified(self.mirrors[index], save_path, digest, validator)
+        return "Complete (verified)"
+
+    def _new_hasher(self, index, part_path, on_disk=()):
+        """A StreamHasher for one attempt, feeding a fresh StreamExtractor when the task has an install folder"""
+        if not self.install_dirs[index]: return StreamHasher(part_path, on_disk)
+        if self.extractors[index]: self.extractors[index].discard()
+        extractor = self.extractors[index] = StreamExtractor(self.install_dirs[index], self.names[index])
+        return StreamHasher(part_path, on_disk, extractor.feed)
+
+    def _install(self, index, save_path, result):
+        """Moves the verified archive's members into the task's install folder"""
+        self._publish(index, 100, f"Installing {self.names[index]}...")
+        target = self.install_dirs[index]
+        extractor = self.extractors[index] or StreamExtractor(target, self.names[index])
+        installed, unchanged = extractor.install(save_path)
+        return f"{result}, installed {installed} file(s) to {target}" + (f" ({unchanged} unchanged)" if unchanged else "")
+
+    def _reuse(self, index, url, save_path, length, validator):
+        """Uses a verified earlier download of the same file instead of fetching it again"""
+        source = find_verified(url, length, validator)
+        if not source: return False
+        if os.path.abspath(source) != os.path.abspath(save_path):
+            shutil.copyfile(source, save_path)
+            with manifest_lock: digest = load_manifest()[url]['sha256']
+            record_verified(self.mirrors[index], save_path, digest, validator)
+        return True
+
+    def _reuse_mirrored(self, index, save_path):
+        """Before racing: a verified copy recorded under any of the task's mirrors, checked against that mirror's
+        own answer to a one-byte probe, so a copy from a mirror the race would not pick is still found"""
+        with manifest_lock: manifest = load_manifest()
+        for url in self.mirrors[index]:
+            if url not in manifest: continue
+            info = self._probe(url)
+            if info['ranged'] and self._reuse(index, url, save_path, info['length'], info['validator']): return True
+        return False
+
+    def _probe(self, url):
+        """Asks for the first byte only; a 206 with a Content-Range total means the host serves byte ranges"""
+        info = {'ranged': False, 'length': 0, 'url': url, 'validator': {}}
+        try:
+            with self.http.get(url, headers={'Range': 'bytes=0-0'}, stream=True, retries=1, deadline=30) as r:
+                content_range = r.headers.get('Content-Range', '')
+                total = content_range.rsplit('/', 1)[-1]
+                if r.status_code == 206 and total.isdigit() and r.headers.get('Accept-Ranges', 'bytes') != 'none':
+                    info.update(ranged=True, length=int(total), url=r.url,
+                                validator={'etag': r.headers.get('ETag'), 'last_modified': r.headers.get('Last-Modified')})
+                    r.content  # the one byte; reading it lets the connection return to the pool
+        except IOError: pass  # requests.RequestException derives from IOError
+        return info
+
+    def _emit_progress(self, index, dl, total_length):
+        """Called as often as data arrives, but only signals the GUI every PROGRESS_INTERVAL (and at 100%)"""
+        if total_length <= 0: return
+        now = time.monotonic()
+        if now - self.last_emit[index] < PROGRESS_INTERVAL and dl < total_length: return
+        previous, self.last_emit[index] = self.last_emit[index], now
+        speed = self.meters[index].update(dl, now)
+        with self.stats_lock: self.stats[index].update(done=dl, total=total_length, speed=speed)
+        METRICS.update(self.records[index], done=dl, total=total_length, speed=speed)
+        percent = int((dl / total_length) * 100)
+        limited = " (limited)" if self.throttled[index] > previous else ""
+        self._publish(index, percent, f"Downloading {self.names[index]} | {percent}% | {format_speed(speed)}{limited}")
+
+    def _throttle(self, index, n, running):
+        """Waits until both the global and this task's speed limit let n more bytes through, noting when either
+        actually held the task back (the "(limited)" marker)"""
+        waited = GLOBAL_BUCKET.consume(n, running)
+        if self.buckets[index].consume(n, running) or waited: self.throttled[index] = time.monotonic()
+
+    def _read_limit(self, index):
+        """Under a speed limit each read is capped at about PROGRESS_INTERVAL worth of data, so a throttled
+        transfer flows evenly instead of in large bursts followed by long sleeps"""
+        rates = [rate for rate in (GLOBAL_BUCKET.rate(), self.buckets[index].rate()) if rate > 0]
+        return min(IO_BUFFER_SIZE, max(16 * 1024, int(min(rates) * PROGRESS_INTERVAL))) if rates else IO_BUFFER_SIZE
+
+    def _start_meter(self, index, dl):
+        self.meters[index] = SpeedMeter()
+        self.meters[index].update(dl, time.monotonic())
+
+    def _publish(self, index, percent, text):
+        """Emits the task's own line, then the combined bar (which is just the task's line for single downloads)"""
+        self.task_progress.emit(index, percent, text)
+        if len(self.tasks) == 1:
+            if percent >= 0: self.progress.emit(percent, text)
+            return
+        with self.stats_lock:
+            done = sum(st['done'] for st in self.stats)
+            total = sum(st['total'] for st in self.stats)
+            speed = sum(st['speed'] for st in self.stats)
+        overall = int((done / total) * 100) if total else 0
+        self.progress.emit(overall, f"Downloading {len(self.tasks)} files | {overall}% | {format_speed(speed)}")
+
+    def _wait_retry(self, index, attempt, error):
+        """Backs off before another attempt at a transfer that broke part-way, showing why on the task's line"""
+        delay = backoff_delay(attempt)
+        HTTP_STATS.add('retries')
+        HTTP_STATS.add('backoff_seconds', delay)
+        METRICS.add(self.records[index], retries=1, stalls=int(is_stall(error)))
+        with self.stats_lock: st = dict(self.stats[index])
+        percent = int((st['done'] / st['total']) * 100) if st['total'] else 0
+        self._publish(index, percent, f"Retrying {self.names[index]} in {delay:.1f}s ({type(error).__name__})")
+        until = time.monotonic() + delay
+        while self.is_running and time.monotonic() < until: time.sleep(min(PROGRESS_INTERVAL, until - time.monotonic()))
+
+    def _download_stream(self, index, url, save_path, hasher, reused):
+        """Single-stream download for hosts without byte ranges. Returns (length, validator) from the response
+        headers, or (None, None) when `reused` accepted an existing verified copy before the body was read."""
+        response = self.http.get(url, stream=True, retries=self.retries[index], timeout=self.timeouts[index])
+        if response.timings['retries']: METRICS.add(self.records[index], retries=response.timings['retries'])
+        try: response.raise_for_status()
+        except IOError as e:
+            response.close()
+            raise DownloadError(str(e)) from e
+        total_length = int(response.headers.get('content-length', 0))
+        validator = {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+        if total_length and reused(total_length, validator):
+            response.close()
+            return None, None
+        dl = 0
+        self._start_meter(index, dl)
+        running = lambda: self.is_running
+        record = self.records[index]
+        with response, open(save_path, 'wb') as f:
+            if total_length: f.truncate(total_length)
+            for chunk in iter_body(response, lambda: self._read_limit(index)):
+                if not self.is_running: break
+                started = time.perf_counter()
+                f.write(chunk)
+                METRICS.add(record, received=len(chunk), write_s=time.perf_counter() - started)
+                hasher.feed(dl, chunk)
+                dl += len(chunk)
+                self._emit_progress(index, dl, total_length)
+                self._throttle(index, len(chunk), running)
+        if self.is_running and total_length and dl != total_length:
+            raise TransferInterrupted(f"Download ended early ({dl} of {total_length} bytes)")
+        return total_length, validator
+
+    def _download_ranges(self, index, url, part_path, ranges, connections, journal, hasher):
+        """Fetches byte ranges on `connections` pooled connections (retuned while running under
+        ADAPTIVE_CONNECTIONS), writing each at its own offset. Every finished (or interrupted) range is
+        recorded in the journal so a later attempt can skip it."""
+        lock, failed = threading.Lock(), threading.Event()
+        validator = journal.validator.get('etag') or journal.validator.get('last_modified')
+        received = [0]
+        record = self.records[index]
+        running = lambda: self.is_running and not failed.is_set()
+
+        def stream_range(cursor, end):
+            """Requests bytes cursor[0]..end and writes them in place, advancing cursor[0] as data lands"""
+            headers = {'Range': f'bytes={cursor[0]}-{end}'}
+            if validator: headers['If-Range'] = validator
+            began = recorded = cursor[0]
+            try:
+                with self.http.get(url, headers=headers, stream=True, retries=self.retries[index],
+                                   timeout=self.timeouts[index]) as r:
+                    if r.timings['retries']: METRICS.add(record, retries=r.timings['retries'])
+                    if r.status_code == 200:
+                        journal.discard()
+                        raise DownloadError("File changed on the server, retry to start over")
+                    if r.status_code != 206: raise DownloadError(f"Range request rejected ({r.status_code})")
+                    with open(part_path, 'r+b') as f:
+                        f.seek(cursor[0])
+                        for chunk in iter_body(r, lambda: self._read_limit(index)):
+                            if failed.is_set() or not self.is_running: return
+                            started = time.perf_counter()
+                            f.write(chunk)
+                            METRICS.add(record, received=len(chunk), write_s=time.perf_counter() - started)
+                            hasher.feed(cursor[0], chunk)
+                            cursor[0] += len(chunk)
+                            with lock: received[0] += len(chunk)
+                            self._throttle(index, len(chunk), running)
+                            if cursor[0] - recorded >= JOURNAL_INTERVAL:
+                                f.flush()
+                                journal.add(began, cursor[0] - 1)
+                                recorded = cursor[0]
+            finally:
+                if cursor[0] > began: journal.add(began, cursor[0] - 1)
+            if cursor[0] <= end: raise TransferInterrupted(f"Connection closed at byte {cursor[0]} of range ending {end}")
+
+        def fetch_range(start, end):
+            """One byte range; a connection that breaks part-way backs off and resumes after the last byte written.
+            Only self.retries[index] failures in a row without progress give up on the whole download."""
+            cursor, failures = [start], 0
+            if self.low_priority: lower_thread_priority()
+            while cursor[0] <= end:
+                if failed.is_set() or not self.is_running: return
+                began = cursor[0]
+                try: stream_range(cursor, end)
+                except Exception as e:
+                    if not is_transient(e): raise
+                    failures = 0 if cursor[0] > began else failures + 1
+                    if failures > self.retries[index]: raise
+                    if tuner: tuner.error()
+                    self._wait_retry(index, failures, e)
+
+        total_length = journal.length
+        already = total_length - sum(end - start + 1 for start, end in ranges)
+        self._start_meter(index, already)
+        last_save = time.time()
+        todo, pending = deque(ranges), set()
+        tuner = ConnectionTuner(connections) if ADAPTIVE_CONNECTIONS and connections > 1 else None
+        with ThreadPoolExecutor(max_workers=tuner.maximum if tuner else connections) as pool:
+            try:
+                while todo or pending:
+                    while todo and len(pending) < (tuner.target if tuner else connections):
+                        pending.add(pool.submit(fetch_range, *todo.popleft()))
+                    finished_jobs, pending = wait(pending, timeout=PROGRESS_INTERVAL, return_when=FIRST_EXCEPTION)
+                    for job in finished_jobs: job.result()
+                    self._emit_progress(index, already + received[0], total_length)
+                    if tuner: tuner.update(received[0], time.monotonic())
+                    if time.time() - last_save > 2: journal.save(); last_save = time.time()
+            except Exception:
+                failed.set()
+                for job in pending: job.cancel()
+                wait(pending)
+                raise
+            finally:
+                journal.save()
+
+# --- WATCH MODE ---
+def notify(message, title="Zuhu's Keys & Firmware Downloader", icon=None):
+    """Desktop notification through plyer when it is installed; does nothing otherwise"""
+    try:
+        from plyer import notification
+        notification.notify(title=title, message=message, app_icon=icon or '', timeout=5)
+    except: pass
+
+def catalog_signature(catalog):
+    """{version: [keys_url, fw_url]}: what a release diff compares"""
+    return {item['version']: [item.get('keys_url'), item.get('fw_url')] for item in catalog}
+
+def diff_catalog(old, new):
+    """Versions that appeared, and versions whose keys or firmware link changed, between two signatures"""
+    return {'added': [ver for ver in new if ver not in old],
+            'changed': [ver for ver in new if ver in old and new[ver] != old[ver]]}
+
+def describe_changes(delta):
+    parts = []
+    if delta['added']: parts.append(f"New: {', '.join(delta['added'])}")
+    if delta['changed']: parts.append(f"Updated: {', '.join(delta['changed'])}")
+    return " | ".join(parts)
+
+def load_watch_state():
+    if os.path.exists(WATCH_FILE):
+        try:
+            with open(WATCH_FILE, 'r') as f: return json.load(f)
+        except: pass
+    return {}
+
+def save_watch_state(signature, prefetch=None):
+    """`prefetch` is the catalog entry whose prefetch has not completed yet"""
+    os.makedirs(os.path.dirname(WATCH_FILE), exist_ok=True)
+    tmp_path = WATCH_FILE + '.tmp'
+    with open(tmp_path, 'w') as f: json.dump({'seen': signature, 'prefetch': prefetch, 'checked_at': time.time()}, f)
+    os.replace(tmp_path, WATCH_FILE)
+
+def prefetch_folder():
+    """Kept apart from the download folders so a prefetch never shares a .part file with a real download"""
+    return os.path.join(DATA_FOLDER, 'Prefetch')
+
+class CatalogWatcher:
+    """Watch mode: every WATCH_INTERVAL minutes revalidates both pages (conditional requests, so an unchanged
+    site costs two 304s) and diffs the catalog against the last one it reported. `changed` fires with
+    {'added', 'changed', 'entries'} only when a version appeared or one of its links changed; the first check
+    only records a baseline (the catalog cached before it). With WATCH_PREFETCH the newest changed release is
+    then downloaded at low priority into prefetch_folder(), where a later download of the same file finds it
+    through the manifest. That release stays in the watch state until its prefetch completes, so one that was
+    stopped or failed is resumed by the next check. `busy` (e.g. "the download queue has work") postpones the
+    prefetch to a later check while it returns True."""
+    changed = Signal(dict)
+    status = Signal(str)
+
+    def __init__(self, busy=None):
+        self.running = False
+        self.busy = busy or (lambda: False)
+        self.wake = threading.Event()
+        self.scraper = self.prefetcher = None
+
+    def run(self):
+        """Blocks, checking until stop()"""
+        self.running = True
+        while self.running:
+            try: self.check()
+            except Exception as e: self.status.emit(f"Watch Error: {e}")
+            self.wake.wait(WATCH_INTERVAL * 60)
+            self.wake.clear()
+
+    def check_now(self):
+        self.wake.set()
+
+    def stop(self):
+        self.running = False
+        if self.scraper: self.scraper.cancel()
+        self.stop_prefetch()
+        self.wake.set()
+
+    def stop_prefetch(self):
+        """Interrupts a running prefetch; its partial files resume on the next one"""
+        if self.prefetcher: self.prefetcher.is_running = False
+
+    def check(self):
+        """One revalidation; returns the delta when something changed, else None"""
+        scraper = self.scraper = ProdKeysScraper()
+        previous = scraper.cache.get('final_list', [])
+        try: catalog = scraper.fetch_data()
+        finally: self.scraper = None
+        if not catalog or not self.running: return None
+        current = catalog_signature(catalog)
+        state = load_watch_state()
+        seen, pending = state.get('seen'), state.get('prefetch')
+        if seen is None: seen = catalog_signature(previous) if previous else current
+        delta = diff_catalog(seen, current)
+        if delta['added'] or delta['changed']:
+            names = set(delta['added'] + delta['changed'])
+            delta['entries'] = [item for item in catalog if item['version'] in names]
+            if WATCH_PREFETCH: pending = delta['entries'][0]
+        else: delta = None
+        save_watch_state(current, pending)
+        if delta: self.changed.emit(delta)
+        else: self.status.emit(f"No new releases ({time.strftime('%H:%M')})")
+        if not (WATCH_PREFETCH and pending and self.running): return delta
+        if self.busy(): self.status.emit(f"Prefetch of {pending['version']} postponed while downloads run")
+        elif self.prefetch(pending): save_watch_state(current)
+        return delta
+
+    def prefetch(self, entry):
+        """Downloads entry's archives at low priority; True once they are all complete"""
+        folder = prefetch_folder()
+        os.makedirs(folder, exist_ok=True)
+        tasks = []
+        if (url := entry.get('keys_url')): tasks.append((url, os.path.join(folder, f"ProdKeys_{entry['version']}.zip")))
+        if (url := entry.get('fw_mirrors') or entry.get('fw_url')):
+            tasks.append((url, os.path.join(folder, f"Firmware_{entry['version']}.zip")))
+        if not tasks: return True
+        result = []
+        self.prefetcher = Downloader(tasks, low_priority=True)
+        self.prefetcher.finished.connect(lambda success, msg: result.append(success))
+        self.prefetcher.finished.connect(lambda success, msg: self.status.emit(f"Prefetch of {entry['version']}: {msg}"))
+        self.status.emit(f"Prefetching {entry['version']} into {folder}...")
+        try: self.prefetcher.run()
+        finally: self.prefetcher = None
+        return result == [True]
@@ -0,0 +1,91 @@
+"""
+StreamExtractor fed real zips in small, odd-sized pieces: the stream walk has to finish on its own, without
+falling back to unpacking the finished file.
+
+Usage: py -m unittest discover tests
+"""
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import switch_core as core
+
+MEMBERS = {
+    'prod.keys': os.urandom(5000),
+    'title.keys': b'0123456789abcdef' * 700,
+    'firmware/a_rather_long_member_name_that_spans_several_feeds.nca': b'x' * 20000 + os.urandom(3000),
+    'firmware/empty.nca': b'',
+}
+CHUNK_SIZES = (1, 3, 7, 33, 61, 4093)
+
+class Unseekable(io.RawIOBase):
+    """Makes zipfile write data descriptors (trailing sizes) after every member"""
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self): return True
+
+    def write(self, b):
+        self.data += b
+        return len(b)
+
+def make_zip(method, trailing=False):
+    out = Unseekable() if trailing else io.BytesIO()
+    with zipfile.ZipFile(out, 'w', method) as zf:
+        for name, data in MEMBERS.items():
+            info = zipfile.ZipInfo(name, (2024, 1, 1, 0, 0, 0))
+            info.compress_type = method
+            info.extra = b'\xfe\xca\x04\x00abcd'  # an unknown extra field the walk has to step over
+            zf.writestr(info, data)
+    return bytes(out.data if trailing else out.getvalue())
+
+class StreamExtractorTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+
+    def extract(self, archive, chunk_size):
+        target = os.path.join(self.tmp, f'target-{chunk_size}')
+        extractor = core.StreamExtractor(target, 'Archive.zip')
+        for start in range(0, len(archive), chunk_size): extractor.feed(archive[start:start + chunk_size])
+        return extractor, target
+
+    def check(self, archive):
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                extractor, target = self.extract(archive, chunk_size)
+                self.assertFalse(extractor.fallback)
+                self.assertTrue(extractor.done)
+                self.assertIsNone(extractor.entry)
+                self.assertEqual(set(extractor.staged), set(MEMBERS))
+                for name, data in MEMBERS.items():
+                    with open(core.member_path(extractor.staging, name), 'rb') as f: self.assertEqual(f.read(), data)
+                archive_path = os.path.join(self.tmp, f'Archive-{chunk_size}.zip')
+                with open(archive_path, 'wb') as f: f.write(archive)
+                self.assertEqual(extractor.install(archive_path), (len(MEMBERS), 0))
+                with open(os.path.join(target, 'prod.keys'), 'rb') as f: self.assertEqual(f.read(), MEMBERS['prod.keys'])
+
+    def test_stored(self):
+        self.check(make_zip(zipfile.ZIP_STORED))
+
+    def test_deflated(self):
+        self.check(make_zip(zipfile.ZIP_DEFLATED))
+
+    def test_deflated_with_data_descriptors(self):
+        self.check(make_zip(zipfile.ZIP_DEFLATED, trailing=True))
+
+    def test_split_inside_name(self):
+        """The case that used to fall back: a feed boundary just past the fixed 30-byte header"""
+        archive = make_zip(zipfile.ZIP_DEFLATED)
+        extractor = core.StreamExtractor(os.path.join(self.tmp, 'target'), 'Archive.zip')
+        for piece in (archive[:33], archive[33:35], archive[35:]): extractor.feed(piece)
+        self.assertFalse(extractor.fallback)
+        self.assertTrue(extractor.done)
+
+if __name__ == '__main__':
+    unittest.main()